@@ -9,10 +9,21 @@ __version__ = "0.2.0"
 
 from .calendar import fetch_calendar, fetch_calendar_async
 from .client import HebcalClient
-from .converter import fetch_converter, fetch_converter_async
+from .converter import (
+    fetch_converter,
+    fetch_converter_async,
+    fetch_converter_bulk,
+    fetch_converter_bulk_async,
+    fetch_converter_many_async,
+)
 from .enums import Endpoint, HebrewLanguage, YahrzeitEventType, YearType
 from .exceptions import HebcalError, HebcalNetworkError, HebcalParseError, HebcalValidationError
-from .leyning import fetch_leyning, fetch_leyning_async
+from .leyning import (
+    fetch_leyning,
+    fetch_leyning_async,
+    fetch_leyning_range,
+    fetch_leyning_range_async,
+)
 from .models import (
     CalendarRequest,
     ConverterRequest,
@@ -24,6 +35,7 @@ from .models import (
     ZmanimRequest,
 )
 from .shabat import fetch_shabbat, fetch_shabbat_async
+from .utils.cache import clear_cache, configure_cache
 from .utils.logger import logger
 from .utils.types import (
     CalendarResponse,
@@ -48,8 +60,9 @@ from .utils.types import (
     ZmanimResponse,
     ZmanimTimes,
 )
+from .utils.utils import aclose_async_client, close_sync_client
 from .yahrzeit import fetch_yahrzeit, fetch_yahrzeit_async
-from .zmanim import fetch_zmanim, fetch_zmanim_async
+from .zmanim import fetch_zmanim, fetch_zmanim_async, fetch_zmanim_many_async, iter_zmanim_async
 
 __all__ = [
     "CalendarRequest",
@@ -90,17 +103,28 @@ __all__ = [
     "ZmanimRequest",
     "ZmanimResponse",
     "ZmanimTimes",
+    "aclose_async_client",
+    "clear_cache",
+    "close_sync_client",
+    "configure_cache",
     "fetch_calendar",
     "fetch_calendar_async",
     "fetch_converter",
     "fetch_converter_async",
+    "fetch_converter_bulk",
+    "fetch_converter_bulk_async",
+    "fetch_converter_many_async",
     "fetch_leyning",
     "fetch_leyning_async",
+    "fetch_leyning_range",
+    "fetch_leyning_range_async",
     "fetch_shabbat",
     "fetch_shabbat_async",
     "fetch_yahrzeit",
     "fetch_yahrzeit_async",
     "fetch_zmanim",
     "fetch_zmanim_async",
+    "fetch_zmanim_many_async",
+    "iter_zmanim_async",
     "logger",
 ]
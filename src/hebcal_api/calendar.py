@@ -2,6 +2,8 @@
 Hebcal Calendar API endpoint interface.
 """
 
+import httpx
+
 from .client import HebcalClient
 from .enums import Endpoint
 from .models import CalendarRequest
@@ -15,8 +17,12 @@ def fetch_calendar(request: CalendarRequest) -> CalendarResponse:
     return HebcalClient.execute(Endpoint.HEBCAL, request, CalendarResponse)
 
 
-async def fetch_calendar_async(request: CalendarRequest) -> CalendarResponse:
+async def fetch_calendar_async(
+    request: CalendarRequest, client: httpx.AsyncClient | None = None
+) -> CalendarResponse:
     """
     Fetch the main Jewish Calendar dates via asynchronous execution.
     """
-    return await HebcalClient.execute_async(Endpoint.HEBCAL, request, CalendarResponse)
+    return await HebcalClient.execute_async(
+        Endpoint.HEBCAL, request, CalendarResponse, client=client
+    )
@@ -2,8 +2,13 @@
 Unified execution engine for Hebcal API requests.
 """
 
-from typing import TypeVar
+from collections.abc import Callable
+from functools import cache
+from typing import Any, TypeVar, cast
 
+import httpx
+
+from .config import BASE_URL
 from .enums import Endpoint
 from .models import (
     CalendarRequest,
@@ -13,8 +18,9 @@ from .models import (
     YahrzeitRequest,
     ZmanimRequest,
 )
+from .utils.cache import cached_fetch, cached_fetch_async, make_cache_key, response_cache
 from .utils.logger import logger
-from .utils.utils import fetch_async, fetch_sync
+from .utils.utils import fetch_async, fetch_content_async, fetch_content_sync, fetch_sync
 
 T = TypeVar("T")
 
@@ -28,6 +34,24 @@ HebcalRequest = (
     | YahrzeitRequest
 )
 
+# Endpoint URLs never change, so they are formatted once rather than per request.
+ENDPOINT_URLS: dict[Endpoint, str] = {
+    endpoint: f"{BASE_URL}/{endpoint.value}" for endpoint in Endpoint
+}
+
+# Longest date range the converter and leyning endpoints accept in one request.
+MAX_RANGE_DAYS = 180
+
+
+@cache
+def _response_factory(response_class: type[Any]) -> Callable[..., Any]:
+    """Resolve how a response class is built from API data, once per class."""
+    for name in ("from_api", "from_dict"):
+        factory = getattr(response_class, name, None)
+        if factory is not None:
+            return factory
+    return response_class
+
 
 class HebcalClient:
     """
@@ -37,6 +61,16 @@ class HebcalClient:
     network execution for both synchronous and asynchronous operations.
     """
 
+    @staticmethod
+    def _prepare(endpoint: Endpoint, request_obj: HebcalRequest) -> tuple[str, dict[str, Any]]:
+        """Resolve the endpoint URL and query parameters for a request."""
+        return ENDPOINT_URLS[endpoint], request_obj.to_api_params()
+
+    @staticmethod
+    def _build_response(response_class: type[T], data: Any, url: str, params: dict[str, Any]) -> T:  # noqa: ANN401
+        """Instantiate `response_class` from decoded API data."""
+        return cast("T", _response_factory(response_class)(data, url=url, params=params))
+
     @staticmethod
     def execute(endpoint: Endpoint, request_obj: HebcalRequest, response_class: type[T]) -> T:
         """
@@ -50,22 +84,24 @@ class HebcalClient:
         Returns:
             An instance of response_class populated with API data.
         """
-        url = f"https://www.hebcal.com/{endpoint.value}"
-        params = request_obj.to_api_params()
-
-        logger.debug(f"Fetching {endpoint.value} from {url} with params {params}")
-        data = fetch_sync(url, params=params)
-
-        if hasattr(response_class, "from_api"):
-            return response_class.from_api(data, url=url, params=params)  # type: ignore
-        if hasattr(response_class, "from_dict"):
-            return response_class.from_dict(data, url=url, params=params)  # type: ignore
-
-        return response_class(data, url=url, params=params)  # type: ignore
+        url, params = HebcalClient._prepare(endpoint, request_obj)
+
+        logger.debug("Fetching {} from {} with params {}", endpoint.value, url, params)
+        if request_obj.relative_to_today():
+            data = fetch_sync(url, params=params)
+        else:
+            data = cached_fetch(
+                make_cache_key(endpoint.value, params),
+                lambda: fetch_content_sync(url, params=params, revalidate=response_cache.enabled),
+            )
+        return HebcalClient._build_response(response_class, data, url, params)
 
     @staticmethod
     async def execute_async(
-        endpoint: Endpoint, request_obj: HebcalRequest, response_class: type[T]
+        endpoint: Endpoint,
+        request_obj: HebcalRequest,
+        response_class: type[T],
+        client: httpx.AsyncClient | None = None,
     ) -> T:
         """
         Execute an asynchronous request.
@@ -74,19 +110,22 @@ class HebcalClient:
             endpoint: The API endpoint.
             request_obj: A validated Pydantic model representing the request.
             response_class: The data class to instantiate.
+            client: Optional httpx.AsyncClient to send the request with, instead of
+                the shared pooled client.
 
         Returns:
             An instance of response_class populated with API data.
         """
-        url = f"https://www.hebcal.com/{endpoint.value}"
-        params = request_obj.to_api_params()
-
-        logger.debug(f"Fetching async {endpoint.value} from {url} with params {params}")
-        data = await fetch_async(url, params=params)
-
-        if hasattr(response_class, "from_api"):
-            return response_class.from_api(data, url=url, params=params)  # type: ignore
-        if hasattr(response_class, "from_dict"):
-            return response_class.from_dict(data, url=url, params=params)  # type: ignore
-
-        return response_class(data, url=url, params=params)  # type: ignore
+        url, params = HebcalClient._prepare(endpoint, request_obj)
+
+        logger.debug("Fetching async {} from {} with params {}", endpoint.value, url, params)
+        if request_obj.relative_to_today():
+            data = await fetch_async(url, params=params, client=client)
+        else:
+            data = await cached_fetch_async(
+                make_cache_key(endpoint.value, params),
+                lambda: fetch_content_async(
+                    url, params=params, client=client, revalidate=response_cache.enabled
+                ),
+            )
+        return HebcalClient._build_response(response_class, data, url, params)
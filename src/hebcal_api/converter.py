@@ -2,13 +2,47 @@
 Hebrew-Gregorian date conversion interface.
 """
 
+import asyncio
+from collections.abc import Iterable
+from datetime import date, datetime
 from typing import Any, cast
 
-from .config import BASE_URL
+import httpx
+
+from .client import ENDPOINT_URLS, MAX_RANGE_DAYS
 from .enums import Endpoint
+from .exceptions import HebcalParseError
 from .models import ConverterRequest
+from .utils.cache import (
+    CONVERTER_CACHE_TTL,
+    cached_fetch,
+    cached_fetch_async,
+    make_cache_key,
+    response_cache,
+)
 from .utils.types import ConverterResponse
-from .utils.utils import fetch_async, fetch_sync
+from .utils.utils import (
+    fetch_content_async,
+    fetch_content_sync,
+    to_date,
+    validate_concurrency,
+)
+
+
+def _to_responses(raw_data: Any, url: str, params: dict[str, Any]) -> list[ConverterResponse]:  # noqa: ANN401
+    """Wrap a single or range conversion payload into a list of ConverterResponses."""
+    if isinstance(raw_data, dict) and "hdates" in raw_data:
+        hdates = cast("dict[str, dict[str, Any]]", raw_data["hdates"])
+        items: list[Any] = []
+        for iso, item in hdates.items():
+            day = date.fromisoformat(iso)
+            items.append({"gy": day.year, "gm": day.month, "gd": day.day, **item})
+    else:
+        items = cast("list[Any]", raw_data) if isinstance(raw_data, list) else [raw_data]
+    return [
+        ConverterResponse.from_api(cast("dict[str, Any]", item), url=url, params=params)
+        for item in items
+    ]
 
 
 def fetch_converter(request: ConverterRequest) -> list[ConverterResponse]:
@@ -23,34 +57,146 @@ def fetch_converter(request: ConverterRequest) -> list[ConverterResponse]:
     """
     params_for_api = request.to_api_params()
 
-    url = f"{BASE_URL}/{Endpoint.CONVERTER.value}"
-    raw_data: Any = fetch_sync(url, params=params_for_api)
-    if isinstance(raw_data, list):
-        return [
-            ConverterResponse.from_api(cast("dict[str, Any]", item), url=url, params=params_for_api)
-            for item in cast("list[Any]", raw_data)
-        ]
-    return [
-        ConverterResponse.from_api(cast("dict[str, Any]", raw_data), url=url, params=params_for_api)
-    ]
+    url = ENDPOINT_URLS[Endpoint.CONVERTER]
+    raw_data: Any = cached_fetch(
+        make_cache_key(Endpoint.CONVERTER.value, params_for_api),
+        lambda: fetch_content_sync(url, params=params_for_api, revalidate=response_cache.enabled),
+        ttl=CONVERTER_CACHE_TTL,
+    )
+    return _to_responses(raw_data, url, params_for_api)
 
 
-async def fetch_converter_async(request: ConverterRequest) -> list[ConverterResponse]:
+async def fetch_converter_async(
+    request: ConverterRequest, client: httpx.AsyncClient | None = None
+) -> list[ConverterResponse]:
     """
     Fetch converted dates via asynchronous execution.
 
     Args:
         request: A ConverterRequest model specifying dates and conversion direction.
+        client: Optional httpx.AsyncClient to use instead of the shared pooled client.
     """
     params_for_api = request.to_api_params()
 
-    url = f"{BASE_URL}/{Endpoint.CONVERTER.value}"
-    raw_data: Any = await fetch_async(url, params=params_for_api)
-    if isinstance(raw_data, list):
-        return [
-            ConverterResponse.from_api(cast("dict[str, Any]", item), url=url, params=params_for_api)
-            for item in cast("list[Any]", raw_data)
-        ]
-    return [
-        ConverterResponse.from_api(cast("dict[str, Any]", raw_data), url=url, params=params_for_api)
-    ]
+    url = ENDPOINT_URLS[Endpoint.CONVERTER]
+    raw_data: Any = await cached_fetch_async(
+        make_cache_key(Endpoint.CONVERTER.value, params_for_api),
+        lambda: fetch_content_async(
+            url, params=params_for_api, client=client, revalidate=response_cache.enabled
+        ),
+        ttl=CONVERTER_CACHE_TTL,
+    )
+    return _to_responses(raw_data, url, params_for_api)
+
+
+async def fetch_converter_many_async(
+    requests: Iterable[ConverterRequest],
+    concurrency: int = 16,
+    client: httpx.AsyncClient | None = None,
+) -> list[list[ConverterResponse]]:
+    """
+    Fetch many independent conversions concurrently.
+
+    At most `concurrency` requests are in flight at once over one async client.
+
+    Args:
+        requests: ConverterRequest models to execute.
+        concurrency: Maximum number of simultaneous API requests.
+        client: Optional httpx.AsyncClient to use instead of the shared pooled client.
+
+    Returns:
+        One list of ConverterResponses per request, in the order given.
+
+    Raises:
+        HebcalValidationError: If `concurrency` is less than 1.
+    """
+    validate_concurrency(concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def convert(request: ConverterRequest) -> list[ConverterResponse]:
+        async with semaphore:
+            return await fetch_converter_async(request, client=client)
+
+    return await asyncio.gather(*(convert(request) for request in requests))
+
+
+def _bulk_requests(days: list[date]) -> list[ConverterRequest]:
+    """Group distinct dates into one request per run of consecutive days."""
+    requests: list[ConverterRequest] = []
+    ordered = sorted(set(days))
+    ordinals = [day.toordinal() for day in ordered]
+    i = 0
+    while i < len(ordered):
+        j = i
+        while (
+            j + 1 < len(ordered)
+            and j + 1 - i < MAX_RANGE_DAYS
+            and ordinals[j + 1] - ordinals[j] == 1
+        ):
+            j += 1
+        if i == j:
+            requests.append(ConverterRequest(date=ordered[i]))
+        else:
+            requests.append(ConverterRequest(start=ordered[i], end=ordered[j]))
+        i = j + 1
+    return requests
+
+
+def _in_input_order(
+    days: list[date], results: Iterable[list[ConverterResponse]]
+) -> list[ConverterResponse]:
+    """Map bulk conversion results back onto the requested days, in their order."""
+    by_day = {
+        date(r.gy, r.gm, r.gd): r
+        for batch in results
+        for r in batch
+        if r.gy is not None and r.gm is not None and r.gd is not None
+    }
+    ordered: list[ConverterResponse] = []
+    for day in days:
+        response = by_day.get(day)
+        if response is None:
+            raise HebcalParseError(f"Converter response is missing {day.isoformat()}")
+        ordered.append(response)
+    return ordered
+
+
+def fetch_converter_bulk(dates: Iterable[date | datetime | str]) -> list[ConverterResponse]:
+    """
+    Convert many Gregorian dates to Hebrew with as few requests as possible.
+
+    Consecutive days are fetched together as one range request, so a month of
+    dates costs a single round-trip instead of thirty.
+
+    Args:
+        dates: Gregorian dates, in any order and possibly repeated.
+
+    Returns:
+        One ConverterResponse per input date, in the order given.
+    """
+    days = [to_date(value) for value in dates]
+    return _in_input_order(days, (fetch_converter(req) for req in _bulk_requests(days)))
+
+
+async def fetch_converter_bulk_async(
+    dates: Iterable[date | datetime | str],
+    concurrency: int = 16,
+    client: httpx.AsyncClient | None = None,
+) -> list[ConverterResponse]:
+    """
+    Asynchronous variant of `fetch_converter_bulk`.
+
+    Range requests for separate runs of days are issued concurrently.
+
+    Args:
+        dates: Gregorian dates, in any order and possibly repeated.
+        concurrency: Maximum number of simultaneous API requests.
+        client: Optional httpx.AsyncClient to use instead of the shared pooled client.
+
+    Raises:
+        HebcalValidationError: If `concurrency` is less than 1.
+    """
+    validate_concurrency(concurrency)
+    days = [to_date(value) for value in dates]
+    results = await fetch_converter_many_async(_bulk_requests(days), concurrency, client)
+    return _in_input_order(days, results)
@@ -61,9 +61,6 @@ def fetch_daf_yomi(dt: str | date | datetime | None = None) -> CalendarResponse:
     """
     req = CalendarRequest(F=True)
     if dt:
-        if isinstance(dt, (datetime, date)):
-            req.start = req.end = dt.strftime("%Y-%m-%d")
-        else:
-            req.start = req.end = dt
+        req.start = req.end = dt
 
     return fetch_calendar(req)
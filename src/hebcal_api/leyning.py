@@ -2,10 +2,18 @@
 Leyning (Torah reading) API endpoint interface.
 """
 
-from .client import HebcalClient
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import Any
+
+import httpx
+
+from .client import ENDPOINT_URLS, MAX_RANGE_DAYS, HebcalClient
 from .enums import Endpoint
+from .exceptions import HebcalValidationError
 from .models import LeyningRequest
 from .utils.types import LeyningResponse
+from .utils.utils import to_date, validate_concurrency
 
 
 def fetch_leyning(request: LeyningRequest) -> LeyningResponse:
@@ -15,8 +23,93 @@ def fetch_leyning(request: LeyningRequest) -> LeyningResponse:
     return HebcalClient.execute(Endpoint.LEYNING, request, LeyningResponse)
 
 
-async def fetch_leyning_async(request: LeyningRequest) -> LeyningResponse:
+async def fetch_leyning_async(
+    request: LeyningRequest, client: httpx.AsyncClient | None = None
+) -> LeyningResponse:
     """
     Fetch Torah reading (Leyning) via asynchronous execution.
     """
-    return await HebcalClient.execute_async(Endpoint.LEYNING, request, LeyningResponse)
+    return await HebcalClient.execute_async(
+        Endpoint.LEYNING, request, LeyningResponse, client=client
+    )
+
+
+def _range_requests(
+    start: date | datetime | str, end: date | datetime | str, diaspora: bool, triennial: bool
+) -> list[LeyningRequest]:
+    """Split [start, end] into consecutive windows the API accepts in one request."""
+    first, last = to_date(start), to_date(end)
+    if first > last:
+        raise HebcalValidationError(f"start ({first}) must not be after end ({last})")
+    requests: list[LeyningRequest] = []
+    while first <= last:
+        window_end = min(first + timedelta(days=MAX_RANGE_DAYS - 1), last)
+        requests.append(
+            LeyningRequest(start=first, end=window_end, diaspora=diaspora, triennial=triennial)
+        )
+        first = window_end + timedelta(days=1)
+    return requests
+
+
+def _merge(requests: list[LeyningRequest], responses: list[LeyningResponse]) -> LeyningResponse:
+    """Combine per-window responses into one response covering the whole range."""
+    params = LeyningRequest(
+        start=requests[0].start,
+        end=requests[-1].end,
+        diaspora=requests[0].diaspora,
+        triennial=requests[0].triennial,
+    ).to_api_params()
+    data: dict[str, Any] = {
+        **responses[0].raw,
+        "range": {"start": responses[0].range_start, "end": responses[-1].range_end},
+        "items": [item for response in responses for item in response.raw.get("items", [])],
+    }
+    return LeyningResponse.from_dict(data, url=ENDPOINT_URLS[Endpoint.LEYNING], params=params)
+
+
+def fetch_leyning_range(
+    start: date | datetime | str,
+    end: date | datetime | str,
+    diaspora: bool = False,
+    triennial: bool = True,
+) -> LeyningResponse:
+    """
+    Fetch Torah readings for a date range of any length.
+
+    Ranges longer than the API's 180-day limit are split into windows and the
+    readings are combined into a single response.
+
+    Raises:
+        HebcalValidationError: If `start` is after `end`.
+    """
+    requests = _range_requests(start, end, diaspora, triennial)
+    return _merge(requests, [fetch_leyning(request) for request in requests])
+
+
+async def fetch_leyning_range_async(
+    start: date | datetime | str,
+    end: date | datetime | str,
+    diaspora: bool = False,
+    triennial: bool = True,
+    concurrency: int = 8,
+    client: httpx.AsyncClient | None = None,
+) -> LeyningResponse:
+    """
+    Asynchronous variant of `fetch_leyning_range`.
+
+    The 180-day windows are fetched concurrently, at most `concurrency` at a time,
+    over `client` when given or the shared pooled client otherwise.
+
+    Raises:
+        HebcalValidationError: If `start` is after `end` or `concurrency` is less than 1.
+    """
+    validate_concurrency(concurrency)
+    requests = _range_requests(start, end, diaspora, triennial)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(request: LeyningRequest) -> LeyningResponse:
+        async with semaphore:
+            return await fetch_leyning_async(request, client=client)
+
+    responses = await asyncio.gather(*(fetch(request) for request in requests))
+    return _merge(requests, list(responses))
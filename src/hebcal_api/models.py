@@ -4,11 +4,64 @@ Pydantic Request models for Hebcal API endpoints.
 
 from datetime import date as dt_date
 from datetime import datetime as dt_datetime
+from functools import lru_cache
 from typing import Any, Literal, cast
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from hebcal_api.enums import HebrewLanguage, YearType
+from hebcal_api.exceptions import HebcalValidationError
+
+
+def _parse_iso_date(value: str) -> tuple[int, int, int]:
+    """Split a 'YYYY-MM-DD' string into (year, month, day) without strptime."""
+    if (
+        len(value) != 10
+        or value[4] != "-"
+        or value[7] != "-"
+        or not (value[:4] + value[5:7] + value[8:]).isdigit()
+    ):
+        raise HebcalValidationError(f"Invalid date {value!r}, expected YYYY-MM-DD")
+    year, month, day = int(value[:4]), int(value[5:7]), int(value[8:])
+    try:
+        dt_date(year, month, day)
+    except ValueError as err:
+        raise HebcalValidationError(f"Invalid date {value!r}: {err}") from err
+    return year, month, day
+
+
+@lru_cache(maxsize=1024)
+def _format_date(value: dt_date | dt_datetime | str) -> str:
+    """
+    Render a date parameter as the 'YYYY-MM-DD' string expected by the API.
+
+    Cached, since bulk workflows format the same few dates over and over.
+    """
+    if isinstance(value, str):
+        _parse_iso_date(value)
+        return value
+    if isinstance(value, dt_datetime):
+        value = value.date()
+    return value.isoformat()
+
+
+def _resolve_geo(
+    geonameid: int | None,
+    city: str | None,
+    zip_code: str | None,
+    latitude: float | None,
+    longitude: float | None,
+) -> str:
+    """Pick the API `geo` mode for a location."""
+    if geonameid:
+        return "geoname"
+    if city:
+        return "city"
+    if zip_code:
+        return "zip"
+    if latitude is not None and longitude is not None:
+        return "pos"
+    raise ValueError("Must provide geonameid, city, zip, or coordinates")
 
 
 class BaseRequest(BaseModel):
@@ -16,6 +69,10 @@ class BaseRequest(BaseModel):
 
     model_config = ConfigDict(extra="ignore", use_enum_values=True)
 
+    def relative_to_today(self) -> bool:
+        """Whether the API answer depends on the current date, so it must not be cached."""
+        return False
+
 
 class LocationConfig(BaseRequest):
     """Shared location configuration for multiple endpoints."""
@@ -28,6 +85,10 @@ class LocationConfig(BaseRequest):
     tzid: str | None = None
 
 
+# Boolean fields of CalendarRequest sent to the API as "on"/"off".
+_CALENDAR_FLAGS = ("maj", "min", "nx", "mf", "ss", "mod", "c", "F", "o")
+
+
 class CalendarRequest(BaseRequest):
     """Request parameters for the /hebcal endpoint."""
 
@@ -79,12 +140,18 @@ class CalendarRequest(BaseRequest):
     def to_api_params(self) -> dict[str, Any]:
         """Convert model to API query parameters."""
         params = self.model_dump(exclude_none=True)
-        # Convert booleans to 'on' or 'off'
-        for key, value in params.items():
-            if isinstance(value, bool):
-                params[key] = "on" if value else "off"
+        for key in _CALENDAR_FLAGS:
+            params[key] = "on" if params[key] else "off"
+        if self.start:
+            params["start"] = _format_date(self.start)
+        if self.end:
+            params["end"] = _format_date(self.end)
         return params
 
+    def relative_to_today(self) -> bool:
+        """The current year is used unless a year or a start/end range is given."""
+        return str(self.year) == "now" and not (self.start and self.end)
+
 
 class ShabbatRequest(BaseRequest):
     """Request parameters for the /shabbat endpoint."""
@@ -104,22 +171,17 @@ class ShabbatRequest(BaseRequest):
     @model_validator(mode="after")
     def validate_location(self) -> "ShabbatRequest":
         """Ensure valid location parameters are provided."""
-        if self.geonameid:
-            self.geo = "geoname"
-        elif self.city:
-            self.geo = "city"
-        elif self.zip:
-            self.geo = "zip"
-        elif self.latitude is not None and self.longitude is not None:
-            self.geo = "pos"
-        else:
-            raise ValueError("Must provide geonameid, city, zip, or coordinates")
+        self.geo = _resolve_geo(self.geonameid, self.city, self.zip, self.latitude, self.longitude)
         return self
 
     def to_api_params(self) -> dict[str, Any]:
         """Convert model to API query parameters."""
         return self.model_dump(exclude_none=True)
 
+    def relative_to_today(self) -> bool:
+        """The endpoint always answers for the upcoming Shabbat."""
+        return True
+
 
 class ZmanimRequest(BaseRequest):
     """Request parameters for the /zmanim endpoint."""
@@ -142,16 +204,7 @@ class ZmanimRequest(BaseRequest):
     def validate_params(self) -> "ZmanimRequest":
         """Validate location and date parameters."""
         # Location validation
-        if self.geonameid:
-            self.geo = "geoname"
-        elif self.city:
-            self.geo = "city"
-        elif self.zip:
-            self.geo = "zip"
-        elif self.latitude is not None and self.longitude is not None:
-            self.geo = "pos"
-        else:
-            raise ValueError("Must provide geonameid, city, zip, or coordinates")
+        self.geo = _resolve_geo(self.geonameid, self.city, self.zip, self.latitude, self.longitude)
 
         # Date validation
         if self.date is not None and (self.start or self.end):
@@ -164,18 +217,11 @@ class ZmanimRequest(BaseRequest):
             exclude={"date", "start", "end"}, exclude_none=True
         )
 
-        def format_dt(dt: dt_date | dt_datetime | str | None) -> str:
-            if not dt:
-                return ""
-            if isinstance(dt, (dt_date, dt_datetime)):
-                return dt.strftime("%Y-%m-%d")
-            return str(dt)
-
         if self.date:
-            params["date"] = format_dt(self.date)
+            params["date"] = _format_date(self.date)
         if self.start and self.end:
-            params["start"] = format_dt(self.start)
-            params["end"] = format_dt(self.end)
+            params["start"] = _format_date(self.start)
+            params["end"] = _format_date(self.end)
 
         if self.sec:
             params["sec"] = "1"
@@ -183,6 +229,10 @@ class ZmanimRequest(BaseRequest):
             params["ue"] = "on"
         return params
 
+    def relative_to_today(self) -> bool:
+        """Without a date or range the API answers for today."""
+        return self.date is None and not (self.start and self.end)
+
 
 class LeyningRequest(BaseRequest):
     """Request parameters for the /leyning endpoint."""
@@ -206,18 +256,11 @@ class LeyningRequest(BaseRequest):
         """Convert model to API query parameters."""
         params: dict[str, Any] = {"cfg": "json"}
 
-        def format_dt(dt: dt_date | dt_datetime | str | None) -> str:
-            if not dt:
-                return ""
-            if isinstance(dt, (dt_date, dt_datetime)):
-                return dt.strftime("%Y-%m-%d")
-            return str(dt)
-
         if self.date:
-            params["date"] = format_dt(self.date)
+            params["date"] = _format_date(self.date)
         elif self.start and self.end:
-            params["start"] = format_dt(self.start)
-            params["end"] = format_dt(self.end)
+            params["start"] = _format_date(self.start)
+            params["end"] = _format_date(self.end)
 
         params["i"] = "on" if self.diaspora else "off"
         params["tri"] = "1" if self.triennial else "0"
@@ -235,14 +278,27 @@ class ConverterRequest(BaseRequest):
     hm: str | None = None
     hy: int | None = None
     date: dt_date | dt_datetime | str | None = None
+    # Gregorian range, converted to Hebrew in a single request
+    start: dt_date | dt_datetime | str | None = None
+    end: dt_date | dt_datetime | str | None = None
     h2g: bool | None = None
     gs: bool = False  # Hebrew date with Sephardic transliteration
 
     @model_validator(mode="after")
     def validate_params(self) -> "ConverterRequest":
         """Ensure either Gregorian or Hebrew parameters are provided."""
-        has_g = all(v is not None for v in [self.gd, self.gm, self.gy]) or self.date
-        has_h = all(v is not None for v in [self.hd, self.hm, self.hy])
+        if self.start or self.end:
+            if not (self.start and self.end):
+                raise ValueError("Date ranges require both start and end")
+            if self.h2g:
+                raise ValueError("Date ranges only convert Gregorian to Hebrew")
+            self.h2g = False
+            return self
+
+        has_g = bool(self.date) or (
+            self.gd is not None and self.gm is not None and self.gy is not None
+        )
+        has_h = self.hd is not None and self.hm is not None and self.hy is not None
 
         if not (has_g or has_h):
             raise ValueError("Must provide Gregorian date info or Hebrew date info")
@@ -254,16 +310,18 @@ class ConverterRequest(BaseRequest):
 
     def to_api_params(self) -> dict[str, Any]:
         """Convert model to API query parameters."""
-        params = self.model_dump(exclude={"date"}, exclude_none=True)
+        params = self.model_dump(exclude={"date", "start", "end"}, exclude_none=True)
 
         if self.date:
-            dt = self.date
-            if isinstance(dt, (dt_date, dt_datetime)):
-                params["date"] = dt.strftime("%Y-%m-%d")
-            else:
-                params["date"] = str(dt)
+            params["date"] = _format_date(self.date)
 
-        params["h2g"] = "1" if self.h2g else "0"
+        if self.start and self.end:
+            params["start"] = _format_date(self.start)
+            params["end"] = _format_date(self.end)
+            del params["h2g"]
+            params["g2h"] = "1"
+        else:
+            params["h2g"] = "1" if self.h2g else "0"
         params["gs"] = "on" if self.gs else "off"
         return params
 
@@ -299,3 +357,7 @@ class YahrzeitRequest(BaseRequest):
             if event.sunset:
                 params[f"s{i}"] = "on"
         return params
+
+    def relative_to_today(self) -> bool:
+        """Anniversaries are listed from the current year onward."""
+        return True
@@ -2,6 +2,8 @@
 Shabbat times API endpoint interface.
 """
 
+import httpx
+
 from .client import HebcalClient
 from .enums import Endpoint
 from .models import ShabbatRequest
@@ -15,8 +17,12 @@ def fetch_shabbat(request: ShabbatRequest) -> CalendarResponse:
     return HebcalClient.execute(Endpoint.SHABBAT, request, CalendarResponse)
 
 
-async def fetch_shabbat_async(request: ShabbatRequest) -> CalendarResponse:
+async def fetch_shabbat_async(
+    request: ShabbatRequest, client: httpx.AsyncClient | None = None
+) -> CalendarResponse:
     """
     Fetch Shabbat times via asynchronous execution.
     """
-    return await HebcalClient.execute_async(Endpoint.SHABBAT, request, CalendarResponse)
+    return await HebcalClient.execute_async(
+        Endpoint.SHABBAT, request, CalendarResponse, client=client
+    )
@@ -0,0 +1,367 @@
+"""
+In-process caching of raw Hebcal API response bodies.
+"""
+
+import asyncio
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from pathlib import Path
+from typing import Any
+
+from hebcal_api.exceptions import HebcalParseError
+from hebcal_api.utils.logger import logger
+from hebcal_api.utils.utils import clear_validators, decode_json
+
+DEFAULT_CACHE_TTL = 3600.0
+DEFAULT_CACHE_SIZE = 1024
+# Date conversions never change, so they are kept until evicted by size.
+CONVERTER_CACHE_TTL = math.inf
+
+CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+CACHE_DIR_ENV = "HEBCAL_CACHE_DIR"
+CACHE_TTL_ENV = "HEBCAL_CACHE_TTL"
+PERSISTENT_CACHE_FILE = "hebcal_api.sqlite"
+
+
+def make_cache_key(endpoint: str, params: dict[str, Any]) -> CacheKey:
+    """
+    Build a hashable cache key from an endpoint name and its query parameters.
+
+    Request models emit their parameters in a fixed field order, so the items are
+    used as-is rather than sorted on every lookup. Two equal dicts built in a
+    different order only cost a cache miss, never a wrong hit.
+    """
+    return (endpoint, tuple(params.items()))
+
+
+def default_ttl() -> float:
+    """
+    Response lifetime in seconds: `$HEBCAL_CACHE_TTL` or `DEFAULT_CACHE_TTL`.
+
+    Values that are not a non-negative number are ignored with a warning, so a
+    misconfigured environment never breaks importing the library.
+    """
+    value = os.environ.get(CACHE_TTL_ENV)
+    if not value:
+        return DEFAULT_CACHE_TTL
+    try:
+        ttl = float(value)
+    except ValueError:
+        ttl = math.nan
+    if math.isnan(ttl) or ttl < 0:
+        logger.warning(
+            "Ignoring invalid {}={!r}; using {} seconds", CACHE_TTL_ENV, value, DEFAULT_CACHE_TTL
+        )
+        return DEFAULT_CACHE_TTL
+    return ttl
+
+
+def default_persistent_path() -> Path:
+    """Location of the on-disk cache: `$HEBCAL_CACHE_DIR` or `~/.cache`."""
+    return Path(os.environ.get(CACHE_DIR_ENV) or "~/.cache").expanduser() / PERSISTENT_CACHE_FILE
+
+
+class PersistentCache:
+    """
+    SQLite-backed response store shared by every process on the machine.
+
+    Used as a second level behind `ResponseCache`, so worker processes reuse each
+    other's responses instead of each paying for the first request. Expiry times
+    are stored as wall-clock timestamps; entries with no expiry are kept forever.
+    The database is opened on first use, and reopened after a fork, so each process
+    has its own connection.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self.path = Path(path).expanduser() if path is not None else default_persistent_path()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        # Connections inherited from parent processes, kept referenced so a child
+        # never closes them (closing a forked SQLite handle can corrupt the parent's).
+        self._inherited: list[sqlite3.Connection] = []
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use, and again in each forked child process."""
+        pid = os.getpid()
+        if self._conn is None or self._pid != pid:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)"
+            )
+            if self._conn is not None:
+                self._inherited.append(self._conn)
+            self._conn, self._pid = conn, pid
+        return self._conn
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> str:
+        return json.dumps(key, separators=(",", ":"), default=str)
+
+    def get(self, key: Hashable) -> tuple[float, bytes] | None:
+        """Return `(expires, body)` for `key`, or None if missing or expired."""
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT value, expires FROM responses WHERE key = ?", (self._encode_key(key),)
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        value, expires = row
+        expires = math.inf if expires is None else expires
+        if expires <= time.time():
+            return None
+        return expires, bytes(value)
+
+    def set(self, key: Hashable, data: bytes, ttl: float) -> None:
+        """Store a response body for `ttl` seconds."""
+        expires = None if math.isinf(ttl) else time.time() + ttl
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)",
+                (self._encode_key(key), data, expires),
+            )
+
+    def delete(self, key: Hashable) -> None:
+        """Drop the entry for `key`, if any."""
+        with self._lock:
+            self._connection().execute(
+                "DELETE FROM responses WHERE key = ?", (self._encode_key(key),)
+            )
+
+    def clear(self) -> None:
+        """Drop every stored entry."""
+        with self._lock:
+            self._connection().execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close this process's database connection, if one was opened."""
+        with self._lock:
+            if self._conn is not None:
+                if self._pid == os.getpid():
+                    self._conn.close()
+                else:
+                    self._inherited.append(self._conn)
+            self._conn = None
+
+
+class ResponseCache:
+    """
+    Bounded TTL cache for raw API response bodies.
+
+    Bodies are kept as immutable bytes and decoded by each caller, so no two
+    results ever share a mutable payload.
+
+    Entries expire `ttl` seconds after insertion and the least recently used entry
+    is evicted once `maxsize` entries are stored. A `ttl` or `maxsize` of 0 disables
+    caching entirely. When a `persistent` store is attached, in-memory misses fall
+    back to it and every new entry is written through to it.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CACHE_TTL,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        persistent: PersistentCache | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.persistent = persistent
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._pending: dict[Hashable, asyncio.Task[Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:  # noqa: ANN401
+        """Return the cached body for `key`, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, data = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return data
+                del self._entries[key]
+        if self.persistent is None or not self.enabled:
+            return None
+        stored = self.persistent.get(key)
+        if stored is None:
+            return None
+        expires, data = stored
+        self._store(key, data, min(self.ttl, expires - time.time()))
+        return data
+
+    def set(self, key: Hashable, data: Any, ttl: float | None = None) -> None:  # noqa: ANN401
+        """
+        Store a response body, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key, usually built with `make_cache_key`.
+            data: Raw API response body.
+            ttl: Lifetime override for this entry; defaults to the cache TTL.
+        """
+        if not self.enabled:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        self._store(key, data, ttl)
+        if self.persistent is not None:
+            self.persistent.set(key, data, ttl)
+
+    def _store(self, key: Hashable, data: Any, ttl: float) -> None:  # noqa: ANN401
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the entry for `key` from memory and the persistent store."""
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.persistent is not None:
+            self.persistent.delete(key)
+
+    def clear(self, *, include_persistent: bool = True) -> None:
+        """Drop every cached entry, including the persistent store unless told otherwise."""
+        with self._lock:
+            self._entries.clear()
+        if include_persistent and self.persistent is not None:
+            self.persistent.clear()
+
+    def get_or_fetch(
+        self, key: Hashable, fetch: Callable[[], Any], ttl: float | None = None
+    ) -> Any:  # noqa: ANN401
+        """Return the cached body for `key`, calling `fetch` on a miss."""
+        data = self.get(key)
+        if data is None:
+            data = fetch()
+            self.set(key, data, ttl)
+        return data
+
+    async def get_or_fetch_async(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: float | None = None
+    ) -> Any:  # noqa: ANN401
+        """
+        Asynchronous variant of `get_or_fetch`.
+
+        Concurrent misses for the same key within one event loop share a single
+        in-flight request instead of each hitting the network.
+        """
+        data = self.get(key)
+        if data is not None:
+            return data
+        if not self.enabled:
+            return await fetch()
+
+        task = self._pending.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._fill(key, fetch, ttl))
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._discard_pending(key, done))
+        return await asyncio.shield(task)
+
+    async def _fill(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: float | None
+    ) -> Any:  # noqa: ANN401
+        data = await fetch()
+        self.set(key, data, ttl)
+        return data
+
+    def _discard_pending(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+
+
+response_cache = ResponseCache(
+    ttl=default_ttl(),
+    persistent=PersistentCache() if os.environ.get(CACHE_DIR_ENV) else None,
+)
+
+
+def cached_fetch(key: Hashable, fetch: Callable[[], bytes], ttl: float | None = None) -> Any:  # noqa: ANN401
+    """
+    Return the decoded payload for `key` from the shared cache, fetching on a miss.
+
+    Every call decodes its own copy of the cached body. A body that fails to
+    decode is dropped so the next call fetches it again.
+    """
+    content = response_cache.get_or_fetch(key, fetch, ttl)
+    try:
+        return decode_json(content)
+    except HebcalParseError:
+        response_cache.discard(key)
+        raise
+
+
+async def cached_fetch_async(
+    key: Hashable, fetch: Callable[[], Awaitable[bytes]], ttl: float | None = None
+) -> Any:  # noqa: ANN401
+    """Asynchronous variant of `cached_fetch`."""
+    content = await response_cache.get_or_fetch_async(key, fetch, ttl)
+    try:
+        return decode_json(content)
+    except HebcalParseError:
+        response_cache.discard(key)
+        raise
+
+
+def configure_cache(
+    ttl: float | None = None,
+    maxsize: int | None = None,
+    persistent: bool | str | os.PathLike[str] | None = None,
+) -> None:
+    """
+    Adjust the shared response cache.
+
+    Clears the in-memory entries; anything already stored on disk is kept so other
+    processes' responses stay reusable. The settings also govern the ETag validator
+    store: while caching is disabled no validators or bodies are kept for
+    revalidation, and any already stored are dropped.
+
+    Args:
+        ttl: Seconds a response stays valid. Pass 0 to disable caching.
+        maxsize: Maximum number of cached responses. Pass 0 to disable caching.
+        persistent: True to back the cache with SQLite at the default location
+            (`$HEBCAL_CACHE_DIR` or `~/.cache`), a path to use a specific database
+            file, or False to detach the on-disk store.
+    """
+    if ttl is not None:
+        response_cache.ttl = ttl
+    if maxsize is not None:
+        response_cache.maxsize = maxsize
+    if persistent is not None:
+        if response_cache.persistent is not None:
+            response_cache.persistent.close()
+        if persistent is False:
+            response_cache.persistent = None
+        else:
+            path = None if persistent is True else persistent
+            response_cache.persistent = PersistentCache(path)
+    response_cache.clear(include_persistent=False)
+    if not response_cache.enabled:
+        clear_validators()
+
+
+def clear_cache() -> None:
+    """Drop every response held by the shared cache, along with stored ETags."""
+    response_cache.clear()
+    clear_validators()
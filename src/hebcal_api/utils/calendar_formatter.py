@@ -2,18 +2,34 @@
 Utility functions for formatting Hebcal API responses into human-readable strings.
 """
 
-from datetime import datetime, timedelta
-from typing import Any
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta
 
 from .types import CalendarResponse, Event, EventType
 from .utils import remove_hebrew_nikud
 
+_SHABBAT_EVENT_TYPES = frozenset({EventType.CANDLES, EventType.HAVDALAH, EventType.SHABBAT})
+
+# Checked in order against the lowercased title; the first match wins.
+_HOLIDAY_EMOJI: tuple[tuple[str, str], ...] = (
+    ("פסח", "🍷"),
+    ("pesach", "🍷"),
+    ("סוכות", "🌿"),
+    ("sucot", "🌿"),
+    ("שמחת תורה", "🌿"),
+    ("ראש השנה", "🍏🍯"),
+    ("hashana", "🍏🍯"),
+    ("יום כיפור", "🕍"),
+    ("kippur", "🕍"),
+)
+
 
 def format_time(dt: datetime | None) -> str:
     """Format datetime to a readable time string."""
     if not dt:
         return ""
-    return dt.strftime("%H:%M")
+    return f"{dt.hour:02d}:{dt.minute:02d}"
 
 
 def format_hebrew_date(hebrew_date: str | None) -> str:
@@ -86,16 +102,8 @@ def format_holiday(event: Event) -> str:
     if not event.holiday:
         return ""
 
-    emoji = "🎉"
-    title_en = event.title.lower()
-    if "פסח" in event.title or "pesach" in title_en:
-        emoji = "🍷"
-    elif "סוכות" in event.title or "sucot" in title_en or "שמחת תורה" in event.title:
-        emoji = "🌿"
-    elif "ראש השנה" in event.title or "hashana" in title_en:
-        emoji = "🍏🍯"
-    elif "יום כיפור" in event.title or "kippur" in title_en:
-        emoji = "🕍"
+    title_lower = event.title.lower()
+    emoji = next((emoji for needle, emoji in _HOLIDAY_EMOJI if needle in title_lower), "🎉")
 
     title = remove_hebrew_nikud(event.hebrew if event.hebrew else event.title)
     return f"{emoji} {title}"
@@ -111,26 +119,36 @@ def format_omer(event: Event) -> str:
     return f"🌾 ספירת העומר: {count} - {sefira}"
 
 
+def format_daf_yomi(event: Event) -> str:
+    """Format daf yomi."""
+    title = remove_hebrew_nikud(event.hebrew if event.hebrew else event.title)
+    return f"📚 דף יומי: {title}"
+
+
+def _format_generic(event: Event) -> str:
+    title = remove_hebrew_nikud(event.hebrew if event.hebrew else event.title)
+    return f"📅 {title}"
+
+
+_FORMATTERS: dict[EventType, Callable[[Event], str]] = {
+    EventType.CANDLES: format_candle_lighting,
+    EventType.HAVDALAH: format_havdalah,
+    EventType.PARASHAT: format_parashat,
+    EventType.ROSH_CHODESH: format_rosh_chodesh,
+    EventType.HOLIDAY: format_holiday,
+    EventType.OMER: format_omer,
+    EventType.DAF_YOMI: format_daf_yomi,
+}
+
+
 def format_event(event: Event) -> str:
     """Format a single calendar event based on its type."""
-    if event.type == EventType.CANDLES:
-        return format_candle_lighting(event)
-    elif event.type == EventType.HAVDALAH:
-        return format_havdalah(event)
-    elif event.type == EventType.PARASHAT:
-        return format_parashat(event)
-    elif event.type == EventType.ROSH_CHODESH:
-        return format_rosh_chodesh(event)
-    elif event.type == EventType.HOLIDAY:
-        return format_holiday(event)
-    elif event.type == EventType.OMER:
-        return format_omer(event)
+    return _FORMATTERS.get(event.type, _format_generic)(event)
 
-    title = remove_hebrew_nikud(event.hebrew if event.hebrew else event.title)
-    if event.type == EventType.DAF_YOMI:
-        return f"📚 דף יומי: {title}"
 
-    return f"📅 {title}"
+def _event_sort_key(event: Event) -> tuple[bool, time, str]:
+    time_value = event.date.time() if event.date else time.max
+    return (event.type != EventType.PARASHAT, time_value, event.type)
 
 
 def format_calendar_events(response: CalendarResponse) -> str:
@@ -147,35 +165,19 @@ def format_calendar_events(response: CalendarResponse) -> str:
     if not response or not response.items:
         return "אין אירועים ליום זה"  # No events for today
 
-    # Group events by date
-    events_by_date: dict[str, list[Event]] = {}
+    # Group events by calendar day
+    events_by_date: defaultdict[date, list[Event]] = defaultdict(list)
     for event in response.items:
-        if not event.date:
-            continue
-        date_key = event.date.strftime("%Y-%m-%d")
-        if date_key not in events_by_date:
-            events_by_date[date_key] = []
-        events_by_date[date_key].append(event)
+        if event.date:
+            events_by_date[event.date.date()].append(event)
 
     # Format each day's events
     result: list[str] = []
-    for date_key in sorted(events_by_date.keys()):
-        date_events = events_by_date[date_key]
-        date_str = date_events[0].date.strftime("%d/%m/%Y") if date_events[0].date else ""
-        result.append(f"\n📅 <b>{date_str}</b>")
-
-        # Sort events by type (prioritize Parashat) and then by time
-        def get_event_sort_key(e: Event) -> tuple[int, Any, str]:
-            # Assign priority to Parashat events (they come first)
-            type_priority = 0 if e.type == EventType.PARASHAT else 1
-            event_dt = e.date
-            time_value = event_dt.time() if event_dt else datetime.max.time()
-            return (type_priority, time_value, str(e.type))
-
-        sorted_events = sorted(date_events, key=get_event_sort_key)
-
-        # Format each event
-        for event in sorted_events:
+    for day in sorted(events_by_date):
+        result.append(f"\n📅 <b>{day:%d/%m/%Y}</b>")
+
+        # Parashat first, then by time of day, then by type
+        for event in sorted(events_by_date[day], key=_event_sort_key):
             formatted = format_event(event)
             if formatted:
                 result.append(f"• {formatted}")
@@ -206,26 +208,18 @@ def get_upcoming_events(response: CalendarResponse, days: int = 7) -> list[Event
         return []
 
     today = datetime.now().date()
-    end_date = today + timedelta(days=days)
-
-    return [
-        event for event in response.items if event.date and today <= event.date.date() <= end_date
-    ]
+    return response.events_between(today, today + timedelta(days=days))
 
 
 def get_holidays(response: CalendarResponse) -> list[Event]:
     """Get all holiday events from the response."""
     if not response or not response.items:
         return []
-    return [e for e in response.items if e.type == EventType.HOLIDAY]
+    return response.events_of_type((EventType.HOLIDAY,))
 
 
 def get_shabbat_events(response: CalendarResponse) -> list[Event]:
     """Get all Shabbat-related events from the response."""
     if not response or not response.items:
         return []
-    return [
-        e
-        for e in response.items
-        if e.type in (EventType.CANDLES, EventType.HAVDALAH, EventType.SHABBAT)
-    ]
+    return response.events_of_type(_SHABBAT_EVENT_TYPES)
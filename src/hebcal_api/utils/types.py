@@ -2,11 +2,34 @@
 Data models representing Hebcal API responses.
 """
 
-import json
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, fields
+from datetime import date as dt_date
 from datetime import datetime
 from enum import StrEnum
-from typing import Any, cast
+from functools import lru_cache
+from heapq import merge
+from typing import Any, NamedTuple, cast
+from urllib.parse import urlencode
+
+from .utils import json_loads
+
+_LEYNING_CATEGORIES = frozenset({"shabbat", "parashat"})
+_ROSH_CHODESH_CATEGORIES = frozenset({"roshchodesh", "rosh chodesh"})
+
+
+@lru_cache(maxsize=256)
+def _encode_query(items: tuple[tuple[str, Any], ...]) -> str:
+    return urlencode(items)
+
+
+def _query_url(url: str | None, params: dict[str, Any] | None) -> str | None:
+    """Full request URL for a response, encoding each distinct parameter set once."""
+    if url and params:
+        return f"{url}?{_encode_query(tuple(params.items()))}"
+    return None
 
 
 class EventType(StrEnum):
@@ -47,7 +70,7 @@ class EventType(StrEnum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     title: str
     city: str
@@ -63,7 +86,7 @@ class Location:
     geonameid: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OmerInfo:
     count_he: str
     count_en: str
@@ -74,7 +97,7 @@ class OmerInfo:
     sefira_en: str
 
 
-@dataclass
+@dataclass(slots=True)
 class HolidayInfo:
     yomtov: bool | None = None
     subcategory: str | None = None
@@ -82,25 +105,24 @@ class HolidayInfo:
     leyning: dict[str, Any] | None = None
 
 
-@dataclass
-class RangeInfo:
+class RangeInfo(NamedTuple):
     start: datetime
     end: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class HavdalahInfo:
     time: datetime | None = None
     memo: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CandleInfo:
     time: datetime | None = None
     memo: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ShabbatInfo:
     torah: str | None = None
     haftarah: str | None = None
@@ -108,7 +130,7 @@ class ShabbatInfo:
     leyning: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RoshChodeshInfo:
     link: str | None = None
     torah: str | None = None
@@ -118,7 +140,7 @@ class RoshChodeshInfo:
     memo: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ZmanimEvent:
     title: str  # e.g. "תְּחִילַּת הַצוֹם"
     date: datetime  # datetime object with tzinfo
@@ -131,7 +153,7 @@ class ZmanimEvent:
     subcat: str | None = None  # sub-category ("fast", "sunrise", etc.)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParashatInfo:
     torah: str | None = None
     haftarah: str | None = None
@@ -153,7 +175,93 @@ class ParashatInfo:
         )
 
 
-@dataclass
+# Lowercased API category to EventType, bypassing the slow Enum constructor.
+_CATEGORY_TO_TYPE: dict[str, EventType] = {t.value: t for t in EventType}
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO date or timestamp; fromisoformat handles bare dates and "Z" suffixes.
+
+    Cached, since the events of a response share a small set of dates and times.
+    """
+    return datetime.fromisoformat(value)
+
+
+def _try_parse_iso(value: Any) -> datetime | None:  # noqa: ANN401
+    """Like `_parse_iso`, but returns None for missing or malformed values."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return _parse_iso(value)
+    except ValueError:
+        return None
+
+
+def _parse_holiday(data: dict[str, Any], event_date: datetime | None) -> dict[str, Any]:
+    return {
+        "holiday": HolidayInfo(
+            yomtov=data.get("yomtov", False),
+            subcategory=data.get("subcat"),
+            memo=data.get("memo"),
+            leyning=data.get("leyning"),
+        )
+    }
+
+
+def _parse_parashat(data: dict[str, Any], event_date: datetime | None) -> dict[str, Any]:
+    return {"parashat": ParashatInfo.from_dict(data.get("leyning", {}))}
+
+
+def _parse_zmanim(data: dict[str, Any], event_date: datetime | None) -> dict[str, Any]:
+    return {
+        "zmanim": ZmanimEvent(
+            title=data.get("title", ""),
+            date=event_date or datetime.now(),
+            type=EventType.ZMANIM,
+            hebrew=data.get("hebrew"),
+            original_title=data.get("title_orig"),
+            memo=data.get("memo"),
+            subcat=data.get("subcat"),
+        )
+    }
+
+
+def _parse_havdalah(data: dict[str, Any], event_date: datetime | None) -> dict[str, Any]:
+    return {"havdalah": HavdalahInfo(time=event_date, memo=data.get("memo"))}
+
+
+def _parse_candles(data: dict[str, Any], event_date: datetime | None) -> dict[str, Any]:
+    return {"candle": CandleInfo(time=event_date, memo=data.get("memo"))}
+
+
+def _parse_rosh_chodesh(data: dict[str, Any], event_date: datetime | None) -> dict[str, Any]:
+    leyning = data.get("leyning", {})
+    return {
+        "roshchodesh": RoshChodeshInfo(
+            link=data.get("link"),
+            torah=leyning.get("torah"),
+            haftarah=leyning.get("haftarah"),
+            maftir=leyning.get("maftir"),
+            portions={k: v for k, v in leyning.items() if k.isdigit()},
+            memo=data.get("memo"),
+        )
+    }
+
+
+# Parsers for the nested details of each event category, keyed by raw API category.
+_CATEGORY_PARSERS: dict[str, Callable[[dict[str, Any], datetime | None], dict[str, Any]]] = {
+    "holiday": _parse_holiday,
+    "parashat": _parse_parashat,
+    "zmanim": _parse_zmanim,
+    "havdalah": _parse_havdalah,
+    "candles": _parse_candles,
+    **dict.fromkeys(_ROSH_CHODESH_CATEGORIES, _parse_rosh_chodesh),
+}
+
+
+@dataclass(slots=True)
 class Event:
     title: str
     date: datetime | None = None
@@ -172,159 +280,89 @@ class Event:
 
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "Event":
+        g = data.get
+        # The API sends categories in lowercase, so they are used as lookup keys as-is
+        category = g("category") or ""
+        event_date = _try_parse_iso(g("date"))
+
+        # Category-specific details, parsed by at most one parser
+        parser = _CATEGORY_PARSERS.get(category)
+        details = parser(data, event_date) if parser else {}
+
         # Parse Omer info
-        omer_info = None
         if "omer" in data:
-            omer_info = OmerInfo(
-                count_he=data["omer"]["count"].get("he", ""),
-                count_en=data["omer"]["count"].get("en", ""),
-                sefira_he=data["omer"]["sefira"].get("he", ""),
-                sefira_translit=data["omer"]["sefira"].get("translit", ""),
-                sefira_en=data["omer"]["sefira"].get("en", ""),
-            )
-
-        # Parse Holiday info
-        holiday_info = None
-        if data.get("category") == "holiday":
-            holiday_info = HolidayInfo(
-                yomtov=data.get("yomtov", False),
-                subcategory=data.get("subcat"),
-                memo=data.get("memo"),
-                leyning=data.get("leyning"),
+            omer = data["omer"]
+            details["omer"] = OmerInfo(
+                count_he=omer["count"].get("he", ""),
+                count_en=omer["count"].get("en", ""),
+                sefira_he=omer["sefira"].get("he", ""),
+                sefira_translit=omer["sefira"].get("translit", ""),
+                sefira_en=omer["sefira"].get("en", ""),
             )
 
         # Parse Shabbat / Parashat info
-        parashat_info = None
-        if data.get("category") == "parashat":
-            parashat_info = ParashatInfo.from_dict(data.get("leyning", {}))
-
-        shabbat_info = None
-        if data.get("category") == "shabbat":
-            leyning = data.get("leyning", {})
-            shabbat_info = ShabbatInfo(
+        if category in _LEYNING_CATEGORIES or "leyning" in data:
+            leyning = g("leyning", {})
+            details["shabbat"] = ShabbatInfo(
                 torah=leyning.get("torah"),
                 haftarah=leyning.get("haftarah"),
                 maftir=leyning.get("maftir"),
                 leyning=leyning,
             )
 
-        zmanim_info = None
-        if data.get("category") == "zmanim":
-            zman_title = data.get("title", "")
-            zman_date_str = data.get("date", "")
-            zmanim_info = ZmanimEvent(
-                title=zman_title,
-                date=datetime.fromisoformat(zman_date_str) if zman_date_str else datetime.now(),
-                type=EventType.ZMANIM,
-                hebrew=data.get("hebrew"),
-                original_title=data.get("title_orig"),
-                memo=data.get("memo"),
-                subcat=data.get("subcat"),
-            )
-
-        # Parse Havdalah info
-        havdalah_info = None
-        if data.get("category") == "havdalah":
-            h_date_str = data.get("date", "")
-            havdalah_info = HavdalahInfo(
-                time=datetime.fromisoformat(h_date_str) if h_date_str else None,
-                memo=data.get("memo"),
-            )
-
-        # Parse Candle info
-        candle_info = None
-        if data.get("category") == "candles":
-            c_date_str = data.get("date", "")
-            candle_info = CandleInfo(
-                time=datetime.fromisoformat(c_date_str) if c_date_str else None,
-                memo=data.get("memo"),
-            )
-
-        # Parse Shabbat / Parashat info (overwrite if leyning exists)
-        if data.get("category") in ("shabbat", "parashat") or "leyning" in data:
-            leyning = data.get("leyning", {})
-            shabbat_info = ShabbatInfo(
-                torah=leyning.get("torah"),
-                haftarah=leyning.get("haftarah"),
-                maftir=leyning.get("maftir"),
-                leyning=leyning,
-            )
-
-        # Parse Rosh Chodesh info
-        roshchodesh_info = None
-        if data.get("category") in ("roshchodesh", "rosh chodesh"):
-            leyning = data.get("leyning", {})
-            roshchodesh_info = RoshChodeshInfo(
-                link=data.get("link"),
-                torah=leyning.get("torah"),
-                haftarah=leyning.get("haftarah"),
-                maftir=leyning.get("maftir"),
-                portions={k: v for k, v in leyning.items() if k.isdigit()},
-                memo=data.get("memo"),
-            )
-
-        # Parse date safely
-        event_date = None
-        if "date" in data:
-            d_str = data["date"]
-            if isinstance(d_str, str):
-                try:
-                    event_date = datetime.fromisoformat(d_str.replace("Z", "+00:00"))
-                except Exception:
-                    try:
-                        event_date = datetime.strptime(d_str, "%Y-%m-%d")
-                    except Exception:
-                        event_date = None
-
         # Determine EventType safely
-        category = str(data.get("category", "")).lower()
-        event_type = (
-            EventType(category) if category in EventType._value2member_map_ else EventType.UNKNOWN
-        )
+        event_type = _CATEGORY_TO_TYPE.get(category, EventType.UNKNOWN)
 
         return Event(
-            title=data.get("title", ""),
+            title=g("title", ""),
             date=event_date,
             type=event_type,
-            hebrew=data.get("hebrew"),
-            link=data.get("link"),
-            original_title=data.get("title_orig"),
-            omer=omer_info,
-            zmanim=zmanim_info,
-            holiday=holiday_info,
-            havdalah=havdalah_info,
-            parashat=parashat_info,
-            candle=candle_info,
-            shabbat=shabbat_info,
-            roshchodesh=roshchodesh_info,
+            hebrew=g("hebrew"),
+            link=g("link"),
+            original_title=g("title_orig"),
+            **details,
         )
 
 
 class CalendarResponse:
+    """
+    Response from the /hebcal endpoint.
+
+    Header fields are parsed once on construction; the event list is parsed on
+    first access and then kept.
+    """
+
+    __slots__ = (
+        "_by_date",
+        "_by_type",
+        "_data",
+        "_items",
+        "_params",
+        "_url",
+        "date",
+        "location",
+        "range",
+        "title",
+        "version",
+    )
+
     def __init__(
         self, data: dict[str, Any], url: str | None = None, params: dict[str, Any] | None = None
     ) -> None:
         self._data = data
         self._url = url
         self._params = params
+        self._items: list[Event] | None = None
+        self._by_date: tuple[list[dt_date], list[Event]] | None = None
+        self._by_type: dict[EventType, list[int]] | None = None
 
-    @property
-    def title(self) -> str:
-        return self._data.get("title", "")
-
-    @property
-    def date(self) -> datetime:
-        d_str = self._data.get("date", "")
-        return datetime.fromisoformat(d_str) if d_str else datetime.now()
-
-    @property
-    def version(self) -> str:
-        return self._data.get("version", "")
+        self.title: str = data.get("title", "")
+        self.version: str = data.get("version", "")
+        d_str = data.get("date", "")
+        self.date: datetime = _parse_iso(d_str) if d_str else datetime.now()
 
-    @property
-    def location(self) -> Location:
-        loc = self._data.get("location", {})
-        return Location(
+        loc = data.get("location", {})
+        self.location = Location(
             title=loc.get("title", ""),
             city=loc.get("city", ""),
             tzid=loc.get("tzid", ""),
@@ -339,23 +377,52 @@ class CalendarResponse:
             geonameid=loc.get("geonameid"),
         )
 
-    @property
-    def range(self) -> RangeInfo | None:
-        r_data = self._data.get("range")
+        self.range: RangeInfo | None = None
+        r_data = data.get("range")
         if r_data:
             start_str = r_data.get("start", "")
             end_str = r_data.get("end", "")
             if start_str and end_str:
-                return RangeInfo(
-                    start=datetime.fromisoformat(start_str),
-                    end=datetime.fromisoformat(end_str),
+                self.range = RangeInfo(
+                    start=_parse_iso(start_str),
+                    end=_parse_iso(end_str),
                 )
-        return None
 
     @property
     def items(self) -> list[Event]:
-        raw_items = self._data.get("items", [])
-        return [Event.from_dict(item) for item in raw_items]
+        if self._items is None:
+            self._items = list(map(Event.from_dict, self._data.get("items", [])))
+        return self._items
+
+    def events_of_type(self, types: Iterable[EventType]) -> list[Event]:
+        """
+        Return the events of the given types, in their original order.
+
+        Item positions are bucketed by type on first use, so later lookups skip
+        scanning the whole response.
+        """
+        items = self.items
+        if self._by_type is None:
+            by_type: defaultdict[EventType, list[int]] = defaultdict(list)
+            for i, event in enumerate(items):
+                by_type[event.type].append(i)
+            self._by_type = dict(by_type)
+        positions = [self._by_type.get(t, []) for t in set(types)]
+        return [items[i] for i in merge(*positions)]
+
+    def events_between(self, start: dt_date, end: dt_date) -> list[Event]:
+        """
+        Return dated events falling on or between `start` and `end`, ordered by date.
+
+        The events are sorted by day once and each later lookup is a binary search.
+        """
+        if self._by_date is None:
+            events = sorted(
+                (e for e in self.items if e.date), key=lambda e: cast("datetime", e.date).date()
+            )
+            self._by_date = ([cast("datetime", e.date).date() for e in events], events)
+        days, events = self._by_date
+        return events[bisect_left(days, start) : bisect_right(days, end)]
 
     @property
     def raw(self) -> dict[str, Any]:
@@ -363,16 +430,10 @@ class CalendarResponse:
 
     @property
     def query(self) -> str | None:
-        if self._url and self._params:
-            from urllib.parse import urlencode
-
-            param_str = urlencode(self._params)
-            return f"{self._url}?{param_str}"
-        return None
+        return _query_url(self._url, self._params)
 
 
-@dataclass
-class ReadingPortion:
+class ReadingPortion(NamedTuple):
     k: str  # book
     b: str  # begin
     e: str  # end
@@ -381,7 +442,7 @@ class ReadingPortion:
     note: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LeyningItem:
     date: datetime
     hdate: str
@@ -406,7 +467,7 @@ class LeyningItem:
             return {k: ReadingPortion(**v) for k, v in d.items()}
 
         return LeyningItem(
-            date=datetime.fromisoformat(data["date"]),
+            date=_parse_iso(data["date"]),
             hdate=data.get("hdate", ""),
             type=data.get("type", ""),
             name_en=data.get("name", {}).get("en", ""),
@@ -425,7 +486,7 @@ class LeyningItem:
     tri_haft: ReadingPortion | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LeyningResponse:
     date: datetime
     location: str
@@ -441,11 +502,11 @@ class LeyningResponse:
         data: dict[str, Any], url: str | None = None, params: dict[str, Any] | None = None
     ) -> "LeyningResponse":
         return LeyningResponse(
-            date=datetime.fromisoformat(data["date"]),
+            date=_parse_iso(data["date"]),
             location=data.get("location", ""),
             range_start=data.get("range", {}).get("start", ""),
             range_end=data.get("range", {}).get("end", ""),
-            items=[LeyningItem.from_dict(item) for item in data.get("items", [])],
+            items=list(map(LeyningItem.from_dict, data.get("items", []))),
             _data=data,
             _url=url,
             _params=params,
@@ -457,15 +518,10 @@ class LeyningResponse:
 
     @property
     def query(self) -> str | None:
-        if self._url and self._params:
-            from urllib.parse import urlencode
-
-            param_str = urlencode(self._params)
-            return f"{self._url}?{param_str}"
-        return None
+        return _query_url(self._url, self._params)
 
 
-@dataclass
+@dataclass(slots=True)
 class ZmanimTimes:
     chatzot_night: str | None = None
     alot_ha_shachar: str | None = None
@@ -500,42 +556,47 @@ class ZmanimTimes:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ZmanimTimes":
-        mapping = {
-            "chatzot_night": data.get("chatzotNight"),
-            "alot_ha_shachar": data.get("alotHaShachar"),
-            "misheyakir": data.get("misheyakir"),
-            "misheyakir_machmir": data.get("misheyakirMachmir"),
-            "dawn": data.get("dawn"),
-            "sunrise": data.get("sunrise"),
-            "sea_level_sunrise": data.get("seaLevelSunrise"),
-            "sof_zman_shma_mga_19_8": data.get("sofZmanShmaMGA19Point8"),
-            "sof_zman_shma_mga_16_1": data.get("sofZmanShmaMGA16Point1"),
-            "sof_zman_shma_mga": data.get("sofZmanShmaMGA"),
-            "sof_zman_shma": data.get("sofZmanShma"),
-            "sof_zman_tfilla_mga_19_8": data.get("sofZmanTfillaMGA19Point8"),
-            "sof_zman_tfilla_mga_16_1": data.get("sofZmanTfillaMGA16Point1"),
-            "sof_zman_tfilla_mga": data.get("sofZmanTfillaMGA"),
-            "sof_zman_tfilla": data.get("sofZmanTfilla"),
-            "chatzot": data.get("chatzot"),
-            "mincha_gedola": data.get("minchaGedola"),
-            "mincha_gedola_mga": data.get("minchaGedolaMGA"),
-            "mincha_ketana": data.get("minchaKetana"),
-            "mincha_ketana_mga": data.get("minchaKetanaMGA"),
-            "plag_ha_mincha": data.get("plagHaMincha"),
-            "sea_level_sunset": data.get("seaLevelSunset"),
-            "sunset": data.get("sunset"),
-            "bein_ha_shmashos": data.get("beinHaShmashos"),
-            "dusk": data.get("dusk"),
-            "tzeit_7_083deg": data.get("tzeit7083deg"),
-            "tzeit_8_5deg": data.get("tzeit85deg"),
-            "tzeit_42min": data.get("tzeit42min"),
-            "tzeit_50min": data.get("tzeit50min"),
-            "tzeit_72min": data.get("tzeit72min"),
-        }
-        return cls(**mapping)
-
-
-@dataclass
+        return cls(*map(data.get, _ZMANIM_API_KEYS))
+
+
+# API key for each ZmanimTimes field.
+_ZMANIM_FIELD_KEYS = {
+    "chatzot_night": "chatzotNight",
+    "alot_ha_shachar": "alotHaShachar",
+    "misheyakir": "misheyakir",
+    "misheyakir_machmir": "misheyakirMachmir",
+    "dawn": "dawn",
+    "sunrise": "sunrise",
+    "sea_level_sunrise": "seaLevelSunrise",
+    "sof_zman_shma_mga_19_8": "sofZmanShmaMGA19Point8",
+    "sof_zman_shma_mga_16_1": "sofZmanShmaMGA16Point1",
+    "sof_zman_shma_mga": "sofZmanShmaMGA",
+    "sof_zman_shma": "sofZmanShma",
+    "sof_zman_tfilla_mga_19_8": "sofZmanTfillaMGA19Point8",
+    "sof_zman_tfilla_mga_16_1": "sofZmanTfillaMGA16Point1",
+    "sof_zman_tfilla_mga": "sofZmanTfillaMGA",
+    "sof_zman_tfilla": "sofZmanTfilla",
+    "chatzot": "chatzot",
+    "mincha_gedola": "minchaGedola",
+    "mincha_gedola_mga": "minchaGedolaMGA",
+    "mincha_ketana": "minchaKetana",
+    "mincha_ketana_mga": "minchaKetanaMGA",
+    "plag_ha_mincha": "plagHaMincha",
+    "sea_level_sunset": "seaLevelSunset",
+    "sunset": "sunset",
+    "bein_ha_shmashos": "beinHaShmashos",
+    "dusk": "dusk",
+    "tzeit_7_083deg": "tzeit7083deg",
+    "tzeit_8_5deg": "tzeit85deg",
+    "tzeit_42min": "tzeit42min",
+    "tzeit_50min": "tzeit50min",
+    "tzeit_72min": "tzeit72min",
+}
+# API keys in ZmanimTimes field order, so from_dict can construct positionally.
+_ZMANIM_API_KEYS = tuple(_ZMANIM_FIELD_KEYS[f.name] for f in fields(ZmanimTimes))
+
+
+@dataclass(slots=True)
 class ZmanimResponse:
     date: Any
     version: str
@@ -567,16 +628,10 @@ class ZmanimResponse:
 
     @property
     def query(self) -> str | None:
-        if self._url and self._params:
-            from urllib.parse import urlencode
-
-            param_str = urlencode(self._params)
-            return f"{self._url}?{param_str}"
-        return None
+        return _query_url(self._url, self._params)
 
 
-@dataclass
-class HebrewDateParts:
+class HebrewDateParts(NamedTuple):
     yy: int
     mm: int
     dd: int
@@ -585,14 +640,14 @@ class HebrewDateParts:
     @staticmethod
     def from_api(data: dict[str, Any]) -> "HebrewDateParts":
         return HebrewDateParts(
-            yy=int(data.get("yy", 0)),
-            mm=int(data.get("mm", 0)),
-            dd=int(data.get("dd", 0)),
-            month_name=str(data.get("month_name", "")),
+            int(data.get("yy", 0)),
+            int(data.get("mm", 0)),
+            int(data.get("dd", 0)),
+            str(data.get("month_name", "")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class YahrzeitEvent:
     title: str
     date: datetime | None = None
@@ -604,13 +659,7 @@ class YahrzeitEvent:
 
     @staticmethod
     def from_api(data: dict[str, Any]) -> "YahrzeitEvent":
-        date_str = data.get("date")
-        parsed_date = None
-        if date_str:
-            try:
-                parsed_date = datetime.fromisoformat(str(date_str))
-            except (ValueError, TypeError):
-                parsed_date = None
+        parsed_date = _try_parse_iso(data.get("date"))
 
         y_title = str(data.get("title", ""))
         y_cat = str(data.get("category", ""))
@@ -627,7 +676,7 @@ class YahrzeitEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class YahrzeitResponse:
     events: list[YahrzeitEvent]
     _data: dict[str, Any] | None = None  # Store raw data
@@ -643,7 +692,7 @@ class YahrzeitResponse:
         if isinstance(events_data, str):
             # If events is a string, try to parse it as JSON
             try:
-                events_data = json.loads(events_data)
+                events_data = json_loads(events_data)
             except Exception:
                 events_data = []
 
@@ -664,15 +713,10 @@ class YahrzeitResponse:
 
     @property
     def query(self) -> str | None:
-        if self._url and self._params:
-            from urllib.parse import urlencode
-
-            param_str = urlencode(self._params)
-            return f"{self._url}?{param_str}"
-        return None
+        return _query_url(self._url, self._params)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConverterResponse:
     # Gregorian → Hebrew
     gy: int | None = None
@@ -694,13 +738,7 @@ class ConverterResponse:
     def from_api(
         data: dict[str, Any], url: str | None = None, params: dict[str, Any] | None = None
     ) -> "ConverterResponse":
-        date_str = data.get("date")
-        parsed_date = None
-        if date_str:
-            try:
-                parsed_date = datetime.fromisoformat(str(date_str))
-            except (ValueError, TypeError):
-                parsed_date = None
+        parsed_date = _try_parse_iso(data.get("date"))
 
         return ConverterResponse(
             gy=data.get("gy"),
@@ -723,9 +761,4 @@ class ConverterResponse:
 
     @property
     def query(self) -> str | None:
-        if self._url and self._params:
-            from urllib.parse import urlencode
-
-            param_str = urlencode(self._params)
-            return f"{self._url}?{param_str}"
-        return None
+        return _query_url(self._url, self._params)
@@ -2,70 +2,312 @@
 Shared networking and string processing utilities.
 """
 
-import re
+import asyncio
+import atexit
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from contextlib import suppress
+from datetime import date, datetime
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import httpx
 
-from hebcal_api.exceptions import HebcalNetworkError, HebcalValidationError
+# Decode with the fastest JSON parser available; both are optional speedups.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from msgspec.json import Decoder
 
+        # A reusable decoder skips the per-call setup of msgspec.json.decode.
+        json_loads = Decoder().decode
+    except ImportError:
+        from json import loads as json_loads
 
-async def fetch_async(
+from hebcal_api.exceptions import HebcalNetworkError, HebcalParseError, HebcalValidationError
+
+# Keep enough idle connections for concurrent batch helpers, and hold them open
+# long enough that bursts of requests reuse the same TLS sessions.
+POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64, keepalive_expiry=75)
+
+# Multiplex concurrent requests over one connection when the optional `h2` package
+# (the `http2` extra) is installed; otherwise stay on HTTP/1.1.
+HTTP2 = find_spec("h2") is not None
+
+_sync_client: httpx.Client | None = None
+_async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    WeakKeyDictionary()
+)
+
+
+def get_sync_client() -> httpx.Client:
+    """Return the process-wide HTTP client, keeping connections to Hebcal alive."""
+    global _sync_client
+    if _sync_client is None or _sync_client.is_closed:
+        _sync_client = httpx.Client(follow_redirects=True, limits=POOL_LIMITS, http2=HTTP2)
+    return _sync_client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the shared async HTTP client bound to the running event loop.
+
+    The client stays open until `aclose_async_client()` is awaited on the same loop;
+    call it before the loop is closed. Clients still open at interpreter exit are
+    closed then if their loop is still usable.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(follow_redirects=True, limits=POOL_LIMITS, http2=HTTP2)
+        _async_clients[loop] = client
+    return client
+
+
+def close_sync_client() -> None:
+    """Close the shared synchronous client and its pooled connections."""
+    global _sync_client
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
+
+
+async def aclose_async_client() -> None:
+    """Close the shared async client bound to the running event loop."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _close_async_clients() -> None:
+    """
+    Close leftover shared async clients from outside any running loop.
+
+    Only clients whose loop is still open and idle can be closed; a client whose
+    loop was closed first can no longer be awaited and is just dropped.
+    """
+    for loop, client in list(_async_clients.items()):
+        if not client.is_closed and not loop.is_closed() and not loop.is_running():
+            with suppress(Exception):
+                loop.run_until_complete(client.aclose())
+    _async_clients.clear()
+
+
+atexit.register(close_sync_client)
+atexit.register(_close_async_clients)
+
+# ETag validators for recent cacheable responses, so refetching an expired cache entry
+# can be answered with a bodiless 304 Not Modified instead of the full payload. Only
+# requests made with `revalidate=True` (the response cache, while enabled) use them.
+VALIDATOR_CACHE_SIZE = 256
+
+_ValidatorKey = tuple[str, tuple[tuple[str, Any], ...]]
+# Raw response bodies are stored rather than decoded payloads, so a 304 hands each
+# caller a freshly decoded object instead of one shared, mutable dict.
+_validators: OrderedDict[_ValidatorKey, tuple[str, bytes]] = OrderedDict()
+_validators_lock = threading.Lock()
+
+
+def _with_validator(
+    key: _ValidatorKey, headers: dict[str, str] | None
+) -> tuple[tuple[str, bytes] | None, dict[str, str] | None]:
+    """Look up a stored ETag for `key` and add it to the request headers."""
+    with _validators_lock:
+        stored = _validators.get(key)
+    if stored is None:
+        return None, headers
+    return stored, {**(headers or {}), "If-None-Match": stored[0]}
+
+
+def _content(
+    key: _ValidatorKey,
+    response: httpx.Response,
+    stored: tuple[str, bytes] | None,
+    revalidate: bool,
+) -> bytes:
+    """Return a response body, reusing the stored body on 304 and recording new ETags."""
+    if stored is not None and response.status_code == 304:
+        return stored[1]
+    response.raise_for_status()
+    content = response.content
+    etag = response.headers.get("ETag")
+    if revalidate and etag:
+        with _validators_lock:
+            _validators[key] = (etag, content)
+            _validators.move_to_end(key)
+            while len(_validators) > VALIDATOR_CACHE_SIZE:
+                _validators.popitem(last=False)
+    return content
+
+
+def clear_validators() -> None:
+    """Forget every stored ETag."""
+    with _validators_lock:
+        _validators.clear()
+
+
+def decode_json(content: bytes) -> Any:  # noqa: ANN401
+    """Decode a JSON response body, raising HebcalParseError if it is malformed."""
+    try:
+        return json_loads(content)
+    except Exception as e:
+        raise HebcalParseError(f"Invalid JSON response: {e}") from e
+
+
+# Body of the 404 Hebcal returns for an unknown location.
+_UNKNOWN_GEONAMEID = "can't find geonameid"
+
+
+def _status_error(error: httpx.HTTPStatusError) -> HebcalValidationError | HebcalNetworkError:
+    """Map an HTTP error status to the library exception to raise."""
+    message = error.response.text or str(error)
+    if error.response.status_code == 404 and _UNKNOWN_GEONAMEID in message.lower():
+        return HebcalValidationError(message)
+    return HebcalNetworkError(
+        f"API request failed: {message}", status_code=error.response.status_code
+    )
+
+
+async def fetch_content_async(
     url: str,
     params: dict[str, Any] | None = None,
     timeout: int = 10,
     headers: dict[str, str] | None = None,
-) -> Any:  # noqa: ANN401
-    """Execute an asynchronous GET request."""
+    client: httpx.AsyncClient | None = None,
+    revalidate: bool = False,
+) -> bytes:
+    """
+    Execute an asynchronous GET request and return the raw response body.
+
+    Uses `client` when given, otherwise the shared client for the running loop.
+    With `revalidate`, a response's ETag and body are kept so a later call for the
+    same URL sends If-None-Match and reuses the body on 304 Not Modified.
+    """
+    key = (url, tuple(params.items()) if params else ())
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout, headers=headers, follow_redirects=True
-        ) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        stored, headers = _with_validator(key, headers) if revalidate else (None, headers)
+        response = await (client or get_async_client()).get(
+            url, params=params, headers=headers, timeout=timeout
+        )
+        return _content(key, response, stored, revalidate)
     except httpx.HTTPStatusError as e:
-        error_message = e.response.text or str(e)
-        if e.response.status_code == 404 and "can't find geonameid" in error_message.lower():
-            raise HebcalValidationError(error_message) from e
-
-        raise HebcalNetworkError(
-            f"API request failed: {error_message}", status_code=e.response.status_code
-        ) from e
+        raise _status_error(e) from e
     except Exception as e:
         raise HebcalNetworkError(f"Unexpected network error: {e}") from e
 
 
-def fetch_sync(
+async def fetch_async(
     url: str,
     params: dict[str, Any] | None = None,
     timeout: int = 10,
     headers: dict[str, str] | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> Any:  # noqa: ANN401
-    """Execute a synchronous GET request."""
+    """Execute an asynchronous GET request and decode its JSON body."""
+    return decode_json(await fetch_content_async(url, params, timeout, headers, client))
+
+
+def validate_concurrency(concurrency: int) -> None:
+    """Reject concurrency limits that would stall or break a batch of requests."""
+    if concurrency < 1:
+        raise HebcalValidationError(f"concurrency must be at least 1, got {concurrency}")
+
+
+async def fetch_many_async(
+    requests: Iterable[tuple[str, dict[str, Any] | None]],
+    client: httpx.AsyncClient | None = None,
+    concurrency: int = 8,
+) -> list[Any]:
+    """
+    Execute many GET requests concurrently over one client.
+
+    Args:
+        requests: (url, params) pairs to fetch.
+        client: Optional client to use instead of the shared one for the running loop.
+        concurrency: Maximum number of requests in flight at once.
+
+    Returns:
+        The decoded payloads, in the order given.
+
+    Raises:
+        HebcalValidationError: If `concurrency` is less than 1.
+    """
+    validate_concurrency(concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(url: str, params: dict[str, Any] | None) -> Any:  # noqa: ANN401
+        async with semaphore:
+            return await fetch_async(url, params=params, client=client)
+
+    return await asyncio.gather(*(fetch(url, params) for url, params in requests))
+
+
+def fetch_content_sync(
+    url: str,
+    params: dict[str, Any] | None = None,
+    timeout: int = 10,
+    headers: dict[str, str] | None = None,
+    client: httpx.Client | None = None,
+    revalidate: bool = False,
+) -> bytes:
+    """
+    Execute a synchronous GET request and return the raw response body.
+
+    Uses `client` when given, otherwise the shared process-wide client.
+    With `revalidate`, a response's ETag and body are kept so a later call for the
+    same URL sends If-None-Match and reuses the body on 304 Not Modified.
+    """
+    key = (url, tuple(params.items()) if params else ())
     try:
-        with httpx.Client(timeout=timeout, headers=headers, follow_redirects=True) as client:
-            response = client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        stored, headers = _with_validator(key, headers) if revalidate else (None, headers)
+        response = (client or get_sync_client()).get(
+            url, params=params, headers=headers, timeout=timeout
+        )
+        return _content(key, response, stored, revalidate)
     except httpx.HTTPStatusError as e:
-        error_message = e.response.text or str(e)
-        if e.response.status_code == 404 and "can't find geonameid" in error_message.lower():
-            raise HebcalValidationError(error_message) from e
-
-        raise HebcalNetworkError(
-            f"API request failed: {error_message}", status_code=e.response.status_code
-        ) from e
+        raise _status_error(e) from e
     except Exception as e:
         raise HebcalNetworkError(f"Unexpected network error: {e}") from e
 
 
+def fetch_sync(
+    url: str,
+    params: dict[str, Any] | None = None,
+    timeout: int = 10,
+    headers: dict[str, str] | None = None,
+    client: httpx.Client | None = None,
+) -> Any:  # noqa: ANN401
+    """Execute a synchronous GET request and decode its JSON body."""
+    return decode_json(fetch_content_sync(url, params, timeout, headers, client))
+
+
+# Hebrew diacritics (U+0591-U+05C7) mapped to None, so str.translate deletes them
+# in a single C-level pass.
+_NIKUD_TABLE = dict.fromkeys(range(0x0591, 0x05C8))
+
+
+@lru_cache(maxsize=1024)
 def remove_hebrew_nikud(text: str) -> str:
     """
     Remove Niqqud (vowels) and other diacritics from Hebrew text.
+
+    Cached, since titles, parasha and sefira names repeat across a response.
     """
     if not text:
         raise HebcalValidationError("Input text cannot be None or empty")
 
-    # Unicode range for Hebrew diacritics: 0x0591-0x05C7
-    return re.sub(r"[\u0591-\u05C7]", "", text)
+    return text.translate(_NIKUD_TABLE)
+
+
+def to_date(value: date | datetime | str) -> date:
+    """Normalize a date, datetime or 'YYYY-MM-DD' string to a date."""
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError as e:
+            raise HebcalValidationError(f"Invalid date {value!r}, expected 'YYYY-MM-DD'") from e
+    return value.date() if isinstance(value, datetime) else value
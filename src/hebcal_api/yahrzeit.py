@@ -2,6 +2,8 @@
 Yahrzeit and Anniversary API endpoint interface.
 """
 
+import httpx
+
 from .client import HebcalClient
 from .enums import Endpoint
 from .models import YahrzeitRequest
@@ -15,8 +17,12 @@ def fetch_yahrzeit(request: YahrzeitRequest) -> YahrzeitResponse:
     return HebcalClient.execute(Endpoint.YAHRZEIT, request, YahrzeitResponse)
 
 
-async def fetch_yahrzeit_async(request: YahrzeitRequest) -> YahrzeitResponse:
+async def fetch_yahrzeit_async(
+    request: YahrzeitRequest, client: httpx.AsyncClient | None = None
+) -> YahrzeitResponse:
     """
     Fetch Yahrzeit details via asynchronous execution.
     """
-    return await HebcalClient.execute_async(Endpoint.YAHRZEIT, request, YahrzeitResponse)
+    return await HebcalClient.execute_async(
+        Endpoint.YAHRZEIT, request, YahrzeitResponse, client=client
+    )
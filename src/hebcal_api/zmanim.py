@@ -2,10 +2,16 @@
 Zmanim (Halachic times) API endpoint interface.
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+
+import httpx
+
 from .client import HebcalClient
 from .enums import Endpoint
 from .models import ZmanimRequest
 from .utils.types import ZmanimResponse
+from .utils.utils import validate_concurrency
 
 
 def fetch_zmanim(request: ZmanimRequest) -> ZmanimResponse:
@@ -15,8 +21,82 @@ def fetch_zmanim(request: ZmanimRequest) -> ZmanimResponse:
     return HebcalClient.execute(Endpoint.ZMANIM, request, ZmanimResponse)
 
 
-async def fetch_zmanim_async(request: ZmanimRequest) -> ZmanimResponse:
+async def fetch_zmanim_async(
+    request: ZmanimRequest, client: httpx.AsyncClient | None = None
+) -> ZmanimResponse:
     """
     Fetch Halachic timings via asynchronous execution.
     """
-    return await HebcalClient.execute_async(Endpoint.ZMANIM, request, ZmanimResponse)
+    return await HebcalClient.execute_async(Endpoint.ZMANIM, request, ZmanimResponse, client=client)
+
+
+async def fetch_zmanim_many_async(
+    requests: Iterable[ZmanimRequest],
+    concurrency: int = 8,
+    client: httpx.AsyncClient | None = None,
+) -> list[ZmanimResponse]:
+    """
+    Fetch Halachic timings for many locations or dates concurrently.
+
+    At most `concurrency` requests are in flight at once over one async client.
+
+    Args:
+        requests: ZmanimRequest models to execute.
+        concurrency: Maximum number of simultaneous API requests.
+        client: Optional httpx.AsyncClient to use instead of the shared pooled client.
+
+    Returns:
+        One ZmanimResponse per request, in the order given.
+
+    Raises:
+        HebcalValidationError: If `concurrency` is less than 1.
+    """
+    validate_concurrency(concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(request: ZmanimRequest) -> ZmanimResponse:
+        async with semaphore:
+            return await fetch_zmanim_async(request, client=client)
+
+    return await asyncio.gather(*(fetch(request) for request in requests))
+
+
+async def iter_zmanim_async(
+    requests: Iterable[ZmanimRequest],
+    concurrency: int = 8,
+    client: httpx.AsyncClient | None = None,
+) -> AsyncIterator[tuple[ZmanimRequest, ZmanimResponse]]:
+    """
+    Fetch Halachic timings concurrently, yielding each result as soon as it arrives.
+
+    Unlike `fetch_zmanim_many_async`, results come back in completion order, so callers
+    can start on early answers before the slowest request finishes. A date range for one
+    location needs no fan-out: a single ZmanimRequest with start/end covers it.
+
+    Args:
+        requests: ZmanimRequest models to execute.
+        concurrency: Maximum number of simultaneous API requests.
+        client: Optional httpx.AsyncClient to use instead of the shared pooled client.
+
+    Yields:
+        (request, response) pairs in completion order.
+
+    Raises:
+        HebcalValidationError: If `concurrency` is less than 1.
+    """
+    validate_concurrency(concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(request: ZmanimRequest) -> tuple[ZmanimRequest, ZmanimResponse]:
+        async with semaphore:
+            return request, await fetch_zmanim_async(request, client=client)
+
+    tasks = [asyncio.ensure_future(fetch(request)) for request in requests]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Reap the cancelled and failed siblings so none is left pending or unretrieved.
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,67 @@
+import asyncio
+
+import httpx
+import pytest
+
+from hebcal_api.utils import utils
+from hebcal_api.utils.cache import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    clear_cache,
+    configure_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_response_cache():
+    """Start every test with an empty, default-configured response cache and no ETags."""
+    configure_cache(ttl=DEFAULT_CACHE_TTL, maxsize=DEFAULT_CACHE_SIZE, persistent=False)
+    clear_cache()
+    yield
+    configure_cache(ttl=DEFAULT_CACHE_TTL, maxsize=DEFAULT_CACHE_SIZE, persistent=False)
+    clear_cache()
+
+
+@pytest.fixture
+def hebcal_routes(monkeypatch):
+    """
+    Serve Hebcal API calls in-process instead of over the network.
+
+    Yields a dict mapping endpoint names (e.g. "converter") to a JSON payload, or to a
+    callable taking the query parameters and returning one. Requests go through the
+    real fetch_sync/fetch_async code paths via an httpx.MockTransport.
+    """
+    routes = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        route = routes[request.url.path.strip("/")]
+        payload = route(dict(request.url.params)) if callable(route) else route
+        return httpx.Response(200, json=payload)
+
+    transport = httpx.MockTransport(handler)
+    sync_client = httpx.Client(transport=transport)
+    async_client = httpx.AsyncClient(transport=transport)
+    monkeypatch.setattr(utils, "get_sync_client", lambda: sync_client)
+    monkeypatch.setattr(utils, "get_async_client", lambda: async_client)
+    yield routes
+    sync_client.close()
+    asyncio.run(async_client.aclose())
+
+
+@pytest.fixture
+async def mock_async_client():
+    """
+    Factory for AsyncClients whose requests are answered by `handler` in-process.
+
+    Clients made during the test are closed afterwards.
+    """
+    clients = []
+
+    def make(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,219 @@
+import asyncio
+import math
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from hebcal_api import (
+    CalendarRequest,
+    HebcalParseError,
+    ZmanimRequest,
+    configure_cache,
+    fetch_calendar,
+    fetch_calendar_async,
+    fetch_zmanim,
+)
+from hebcal_api.utils import utils
+from hebcal_api.utils.cache import (
+    DEFAULT_CACHE_TTL,
+    PersistentCache,
+    ResponseCache,
+    default_ttl,
+    make_cache_key,
+)
+
+CALENDAR_BODY = b'{"title": "Test", "items": []}'
+
+
+class TestResponseCache:
+    """Test suite for the in-process response cache."""
+
+    def test_make_cache_key_stable_for_identical_requests(self):
+        """Test that identical requests produce equal keys, scoped per endpoint."""
+        first = CalendarRequest(year=2024, geonameid=12345, c=True).to_api_params()
+        second = CalendarRequest(c=True, geonameid=12345, year=2024).to_api_params()
+
+        assert make_cache_key("hebcal", first) == make_cache_key("hebcal", second)
+        assert make_cache_key("hebcal", first) != make_cache_key("shabbat", first)
+        assert hash(make_cache_key("hebcal", first))
+
+    def test_entry_expires_after_ttl(self):
+        """Test that entries are dropped once their TTL has elapsed."""
+        cache = ResponseCache(ttl=10)
+        with patch("hebcal_api.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("key", b'{"title": "cached"}')
+            assert cache.get("key") == b'{"title": "cached"}'
+        with patch("hebcal_api.utils.cache.time.monotonic", return_value=111.0):
+            assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_evicted(self):
+        """Test that the cache never grows beyond maxsize."""
+        cache = ResponseCache(maxsize=2)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")
+        cache.set("c", b"3")
+
+        assert cache.get("a") == b"1"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"3"
+
+    def test_per_entry_ttl_override(self):
+        """Test that an entry-level TTL outlives the cache default."""
+        cache = ResponseCache(ttl=10)
+        with patch("hebcal_api.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("key", b'{"hy": 5784}', ttl=math.inf)
+        with patch("hebcal_api.utils.cache.time.monotonic", return_value=1e9):
+            assert cache.get("key") == b'{"hy": 5784}'
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a TTL of 0 bypasses the cache."""
+        cache = ResponseCache(ttl=0)
+        cache.set("key", b'{"title": "cached"}')
+        assert cache.get("key") is None
+
+    def test_persistent_cache_shared_across_instances(self, tmp_path):
+        """Test that a fresh in-memory cache falls back to the SQLite store."""
+        path = tmp_path / "cache.sqlite"
+        key = make_cache_key("hebcal", {"year": 2024})
+        ResponseCache(persistent=PersistentCache(path)).set(key, b'{"title": "disk"}')
+
+        other = ResponseCache(persistent=PersistentCache(path))
+        assert other.get(key) == b'{"title": "disk"}'
+        assert len(other) == 1
+
+    def test_persistent_cache_opens_lazily_per_process(self, tmp_path, monkeypatch):
+        """Test that the database is opened on first use and reopened after a fork."""
+        path = tmp_path / "sub" / "cache.sqlite"
+        store = PersistentCache(path)
+        assert not path.parent.exists()
+
+        store.set("key", b'{"title": "disk"}', ttl=10)
+        parent_conn = store._conn
+        monkeypatch.setattr("hebcal_api.utils.cache.os.getpid", lambda: -1)
+
+        assert store.get("key")[1] == b'{"title": "disk"}'
+        assert store._conn is not parent_conn
+        store.close()
+        parent_conn.execute("SELECT 1")  # the parent's connection is left open
+
+    def test_persistent_entry_expires(self, tmp_path):
+        """Test that expired on-disk entries are ignored."""
+        store = PersistentCache(tmp_path / "cache.sqlite")
+        with patch("hebcal_api.utils.cache.time.time", return_value=100.0):
+            store.set("key", b'{"title": "old"}', ttl=10)
+        with patch("hebcal_api.utils.cache.time.time", return_value=111.0):
+            assert store.get("key") is None
+
+    def test_default_ttl_from_environment(self, monkeypatch):
+        """Test that HEBCAL_CACHE_TTL overrides the default lifetime."""
+        monkeypatch.delenv("HEBCAL_CACHE_TTL", raising=False)
+        assert default_ttl() == DEFAULT_CACHE_TTL
+        monkeypatch.setenv("HEBCAL_CACHE_TTL", "300")
+        assert default_ttl() == 300.0
+
+    @pytest.mark.parametrize("value", ["soon", "nan", "-5"])
+    def test_default_ttl_ignores_invalid_environment(self, monkeypatch, value):
+        """Test that a malformed HEBCAL_CACHE_TTL falls back to the default lifetime."""
+        monkeypatch.setenv("HEBCAL_CACHE_TTL", value)
+        assert default_ttl() == DEFAULT_CACHE_TTL
+
+    @patch("hebcal_api.client.fetch_content_sync")
+    def test_repeated_request_served_from_cache(self, mock_fetch):
+        """Test that identical requests only hit the network once."""
+        mock_fetch.return_value = CALENDAR_BODY
+
+        req = CalendarRequest(year=2024, geonameid=12345)
+        first = fetch_calendar(req)
+        second = fetch_calendar(CalendarRequest(year=2024, geonameid=12345))
+
+        assert first.title == second.title == "Test"
+        mock_fetch.assert_called_once()
+
+    @patch("hebcal_api.client.fetch_content_sync")
+    def test_configure_cache_zero_ttl_bypasses(self, mock_fetch):
+        """Test that configure_cache(ttl=0) forces a fetch on every call."""
+        mock_fetch.return_value = CALENDAR_BODY
+        configure_cache(ttl=0)
+
+        req = CalendarRequest(year=2024, geonameid=12345)
+        fetch_calendar(req)
+        fetch_calendar(req)
+
+        assert mock_fetch.call_count == 2
+
+    @pytest.mark.parametrize("ttl", [DEFAULT_CACHE_TTL, 0])
+    def test_validators_follow_cache_setting(self, monkeypatch, ttl):
+        """Test that ETags are kept only while the response cache is enabled."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, json={"title": "Test", "items": []}, headers={"ETag": '"v1"'}
+            )
+        )
+        client = httpx.Client(transport=transport)
+        monkeypatch.setattr(utils, "get_sync_client", lambda: client)
+        configure_cache(ttl=ttl)
+
+        fetch_calendar(CalendarRequest(year=2024, geonameid=12345))
+        client.close()
+
+        assert bool(utils._validators) is bool(ttl)
+
+    @patch("hebcal_api.client.fetch_content_sync")
+    def test_cached_payload_not_shared(self, mock_fetch):
+        """Test that mutating one response's raw data leaves later cache hits intact."""
+        mock_fetch.return_value = CALENDAR_BODY
+
+        req = CalendarRequest(year=2024, geonameid=12345)
+        fetch_calendar(req).raw["title"] = "mutated"
+
+        assert fetch_calendar(req).raw["title"] == "Test"
+        mock_fetch.assert_called_once()
+
+    @patch("hebcal_api.client.fetch_content_sync")
+    def test_invalid_body_not_cached(self, mock_fetch):
+        """Test that a body failing to decode is dropped instead of served again."""
+        mock_fetch.side_effect = [b"<html>", CALENDAR_BODY]
+
+        req = CalendarRequest(year=2024, geonameid=12345)
+        with pytest.raises(HebcalParseError):
+            fetch_calendar(req)
+
+        assert fetch_calendar(req).title == "Test"
+
+    def test_time_relative_requests_skip_cache(self, hebcal_routes):
+        """Test that requests answered for "today" are fetched on every call."""
+        seen = []
+
+        def zmanim(params):
+            seen.append(params)
+            return {"date": "2024-01-15", "version": "1.0", "location": {}, "times": {}}
+
+        hebcal_routes["zmanim"] = zmanim
+
+        fetch_zmanim(ZmanimRequest(geonameid=12345))
+        fetch_zmanim(ZmanimRequest(geonameid=12345))
+
+        assert len(seen) == 2
+        assert CalendarRequest().relative_to_today()
+        assert not CalendarRequest(year=2024).relative_to_today()
+        assert not ZmanimRequest(date="2024-01-15", geonameid=12345).relative_to_today()
+
+    @patch("hebcal_api.client.fetch_content_async")
+    @pytest.mark.asyncio
+    async def test_concurrent_async_misses_coalesce(self, mock_fetch_async):
+        """Test that concurrent identical async requests share one fetch."""
+
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return b'{"title": "Test Async", "items": []}'
+
+        mock_fetch_async.side_effect = slow_fetch
+
+        req = CalendarRequest(year=2024, geonameid=12345)
+        results = await asyncio.gather(*(fetch_calendar_async(req) for _ in range(5)))
+
+        assert all(r.title == "Test Async" for r in results)
+        mock_fetch_async.assert_called_once()
@@ -1,36 +1,102 @@
-from unittest.mock import patch
+from datetime import UTC, date, datetime
 
 import pytest
 
 from hebcal_api import CalendarRequest, fetch_calendar, fetch_calendar_async
-from hebcal_api.utils.types import CalendarResponse
+from hebcal_api.utils.types import CalendarResponse, Event, EventType
 
 
 class TestCalendar:
     """Test suite for the Calendar functional API."""
 
-    @patch("hebcal_api.client.fetch_sync")
-    def test_fetch_calendar_basic(self, mock_fetch):
+    def test_fetch_calendar_basic(self, hebcal_routes):
         """Test fetch_calendar with basic parameters."""
-        mock_data = {"title": "Test", "items": [], "date": "2024-01-15T00:00:00Z"}
-        mock_fetch.return_value = mock_data
+        hebcal_routes["hebcal"] = {"title": "Test", "items": [], "date": "2024-01-15T00:00:00Z"}
 
         req = CalendarRequest(year=2024, geonameid=12345)
         result = fetch_calendar(req)
 
         assert isinstance(result, CalendarResponse)
-        mock_fetch.assert_called_once()
+        assert result.title == "Test"
 
-    @patch("hebcal_api.client.fetch_async")
     @pytest.mark.asyncio
-    async def test_fetch_calendar_async_basic(self, mock_fetch_async):
+    async def test_fetch_calendar_async_basic(self, hebcal_routes):
         """Test fetch_calendar_async with basic parameters."""
-        mock_data = {"title": "Test Async", "items": [], "date": "2024-01-15T00:00:00Z"}
-        mock_fetch_async.return_value = mock_data
+        hebcal_routes["hebcal"] = {
+            "title": "Test Async",
+            "items": [],
+            "date": "2024-01-15T00:00:00Z",
+        }
 
         req = CalendarRequest(year=2024, geonameid=12345)
         result = await fetch_calendar_async(req)
 
         assert isinstance(result, CalendarResponse)
         assert result.title == "Test Async"
-        mock_fetch_async.assert_called_once()
+
+    def test_to_api_params_boolean_flags(self):
+        """Test that boolean flags are sent as 'on'/'off' and other values untouched."""
+        req = CalendarRequest(year=2024, geonameid=12345, min=False, c=True)
+        params = req.to_api_params()
+
+        assert params["maj"] == "on"
+        assert params["min"] == "off"
+        assert params["c"] == "on"
+        assert params["o"] == "off"
+        assert params["geonameid"] == 12345
+        assert params["year"] == 2024
+
+    def test_event_dates_parsed(self):
+        """Test that bare dates and Z-suffixed timestamps both parse."""
+        bare = Event.from_dict({"title": "Chanukah", "date": "2024-12-25", "category": "holiday"})
+        stamped = Event.from_dict(
+            {"title": "Candle lighting", "date": "2024-12-27T16:15:00Z", "category": "candles"}
+        )
+        invalid = Event.from_dict({"title": "Broken", "date": "not-a-date"})
+
+        assert bare.date == datetime(2024, 12, 25)
+        assert stamped.date == datetime(2024, 12, 27, 16, 15, tzinfo=UTC)
+        assert invalid.date is None
+
+    def test_events_between(self):
+        """Test date-window lookups, including out-of-order and undated items."""
+        response = CalendarResponse(
+            {
+                "items": [
+                    {"title": "C", "date": "2024-01-03"},
+                    {"title": "A", "date": "2024-01-01"},
+                    {"title": "Undated"},
+                    {"title": "B", "date": "2024-01-02T18:00:00+02:00"},
+                ]
+            }
+        )
+
+        assert [e.title for e in response.events_between(date(2024, 1, 2), date(2024, 1, 3))] == [
+            "B",
+            "C",
+        ]
+        assert response.events_between(date(2024, 2, 1), date(2024, 2, 28)) == []
+
+    def test_events_of_type_keeps_order(self):
+        """Test that type lookups merge buckets back into response order."""
+        response = CalendarResponse(
+            {
+                "items": [
+                    {"title": "Candles", "date": "2024-01-05", "category": "candles"},
+                    {"title": "Holiday", "date": "2024-01-05", "category": "holiday"},
+                    {"title": "Havdalah", "date": "2024-01-06", "category": "havdalah"},
+                    {"title": "Candles 2", "date": "2024-01-12", "category": "candles"},
+                ]
+            }
+        )
+
+        shabbat = response.events_of_type((EventType.CANDLES, EventType.HAVDALAH))
+        assert [e.title for e in shabbat] == ["Candles", "Havdalah", "Candles 2"]
+        assert response.events_of_type((EventType.OMER,)) == []
+
+    def test_query_url(self):
+        """Test that responses expose the full request URL."""
+        response = CalendarResponse({}, "https://www.hebcal.com/hebcal", {"v": "1", "year": 2024})
+
+        assert response.query == "https://www.hebcal.com/hebcal?v=1&year=2024"
+        assert CalendarResponse({}).query is None
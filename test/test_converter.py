@@ -1,28 +1,36 @@
-from unittest.mock import patch
-
+import httpx
 import pytest
 
-from hebcal_api import ConverterRequest, fetch_converter, fetch_converter_async
+from hebcal_api import (
+    ConverterRequest,
+    HebcalParseError,
+    HebcalValidationError,
+    fetch_converter,
+    fetch_converter_async,
+    fetch_converter_bulk,
+    fetch_converter_bulk_async,
+    fetch_converter_many_async,
+)
 from hebcal_api.utils.types import ConverterResponse
 
+G2H_PAYLOAD = {
+    "gy": 2024,
+    "gm": 1,
+    "gd": 15,
+    "hy": 5784,
+    "hm": "Tevet",
+    "hd": 25,
+    "hebrew": 'כ"ה בטבת תשפ"ד',
+    "date": "2024-01-15T00:00:00Z",
+}
+
 
 class TestConverter:
     """Test suite for the Converter functional API."""
 
-    @patch("hebcal_api.converter.fetch_sync")
-    def test_fetch_converter_g2h_single(self, mock_fetch):
+    def test_fetch_converter_g2h_single(self, hebcal_routes):
         """Test fetch_converter for single g2h conversion."""
-        mock_data = {
-            "gy": 2024,
-            "gm": 1,
-            "gd": 15,
-            "hy": 5784,
-            "hm": "Tevet",
-            "hd": 25,
-            "hebrew": 'כ"ה בטבת תשפ"ד',
-            "date": "2024-01-15T00:00:00Z",
-        }
-        mock_fetch.return_value = mock_data
+        hebcal_routes["converter"] = G2H_PAYLOAD
 
         req = ConverterRequest(date="2024-01-15", conversion_type="g2h")
         result = fetch_converter(req)
@@ -32,21 +40,10 @@ class TestConverter:
         assert isinstance(result[0], ConverterResponse)
         assert result[0].hy == 5784
 
-    @patch("hebcal_api.converter.fetch_async")
     @pytest.mark.asyncio
-    async def test_fetch_converter_async_g2h_single(self, mock_fetch_async):
+    async def test_fetch_converter_async_g2h_single(self, hebcal_routes):
         """Test fetch_converter_async for single g2h conversion."""
-        mock_data = {
-            "gy": 2024,
-            "gm": 1,
-            "gd": 15,
-            "hy": 5784,
-            "hm": "Tevet",
-            "hd": 25,
-            "hebrew": 'כ"ה בטבת תשפ"ד',
-            "date": "2024-01-15T00:00:00Z",
-        }
-        mock_fetch_async.return_value = mock_data
+        hebcal_routes["converter"] = G2H_PAYLOAD
 
         req = ConverterRequest(date="2024-01-15", conversion_type="g2h")
         result = await fetch_converter_async(req)
@@ -54,3 +51,119 @@ class TestConverter:
         assert isinstance(result, list)
         assert len(result) == 1
         assert result[0].hy == 5784
+
+    @pytest.mark.asyncio
+    async def test_fetch_converter_many_async_preserves_order(self, hebcal_routes):
+        """Test that batched conversions run concurrently and keep input order."""
+        seen = []
+
+        def convert(params):
+            seen.append(params)
+            return {"gy": 2024, "gm": 1, "gd": int(params["date"][-2:]), "hy": 5784}
+
+        hebcal_routes["converter"] = convert
+
+        dates = ["2024-01-15", "2024-01-03", "2024-01-27"]
+        results = await fetch_converter_many_async(
+            [ConverterRequest(date=d) for d in dates], concurrency=2
+        )
+
+        assert [r[0].gd for r in results] == [15, 3, 27]
+        assert len(seen) == 3
+
+    def test_direction_inferred_from_date_parts(self):
+        """Test that h2g is inferred only when every Hebrew date part is given."""
+        assert ConverterRequest(hd=25, hm="Tevet", hy=5784).h2g is True
+        assert ConverterRequest(gd=15, gm=1, gy=2024).h2g is False
+        assert ConverterRequest(date="2024-01-15").to_api_params()["h2g"] == "0"
+
+        with pytest.raises(ValueError, match="Must provide"):
+            ConverterRequest(hd=25, hm="Tevet")
+
+    def test_range_request_params(self):
+        """Test that a start/end range is sent as a g2h range query."""
+        params = ConverterRequest(start="2024-01-01", end="2024-01-03").to_api_params()
+
+        assert params["start"] == "2024-01-01"
+        assert params["end"] == "2024-01-03"
+        assert params["g2h"] == "1"
+        assert "h2g" not in params
+
+        with pytest.raises(ValueError, match="only convert Gregorian to Hebrew"):
+            ConverterRequest(start="2024-01-01", end="2024-01-03", h2g=True)
+
+    def test_fetch_converter_bulk_groups_consecutive_days(self, hebcal_routes):
+        """Test that consecutive dates share one range request and keep input order."""
+        seen = []
+
+        def convert(params):
+            seen.append(params)
+            if "start" in params:
+                return {
+                    "start": params["start"],
+                    "end": params["end"],
+                    "hdates": {
+                        "2024-01-01": {"hy": 5784, "hm": "Tevet", "hd": 20},
+                        "2024-01-02": {"hy": 5784, "hm": "Tevet", "hd": 21},
+                    },
+                }
+            return {"gy": 2024, "gm": 3, "gd": 1, "hy": 5784, "hm": "Adar I", "hd": 21}
+
+        hebcal_routes["converter"] = convert
+
+        result = fetch_converter_bulk(["2024-03-01", "2024-01-02", "2024-01-01", "2024-01-02"])
+
+        assert [r.hd for r in result] == [21, 21, 20, 21]
+        assert [r.gd for r in result] == [1, 2, 1, 2]
+        assert len(seen) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_converter_bulk_async_scattered_dates(self, hebcal_routes):
+        """Test that non-consecutive dates fall back to one request each."""
+        seen = []
+
+        def convert(params):
+            seen.append(params)
+            day = int(params["date"][-2:])
+            return {"gy": 2024, "gm": 1, "gd": day, "hy": 5784, "hm": "Tevet", "hd": day + 19}
+
+        hebcal_routes["converter"] = convert
+
+        result = await fetch_converter_bulk_async(["2024-01-10", "2024-01-05"])
+
+        assert [r.hd for r in result] == [29, 24]
+        assert len(seen) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_converter_bulk_async_with_client(self, mock_async_client):
+        """Test that a caller-supplied AsyncClient is forwarded to every request."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.params["date"])
+            return httpx.Response(200, json={**G2H_PAYLOAD, "gd": int(seen[-1][-2:])})
+
+        result = await fetch_converter_bulk_async(
+            ["2024-01-15", "2024-01-03"], client=mock_async_client(handler)
+        )
+
+        assert [r.gd for r in result] == [15, 3]
+        assert sorted(seen) == ["2024-01-03", "2024-01-15"]
+
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    @pytest.mark.asyncio
+    async def test_batch_conversions_reject_invalid_concurrency(self, concurrency):
+        """Test that a concurrency below 1 is rejected instead of hanging."""
+        with pytest.raises(HebcalValidationError, match="concurrency must be at least 1"):
+            await fetch_converter_many_async([ConverterRequest(date="2024-01-15")], concurrency)
+        with pytest.raises(HebcalValidationError, match="concurrency must be at least 1"):
+            await fetch_converter_bulk_async(["2024-01-15"], concurrency)
+
+    def test_fetch_converter_bulk_missing_day(self, hebcal_routes):
+        """Test that a range response leaving out a requested day raises HebcalParseError."""
+        hebcal_routes["converter"] = {
+            "hdates": {"2024-01-01": {"hy": 5784, "hm": "Tevet", "hd": 20}}
+        }
+
+        with pytest.raises(HebcalParseError, match="missing 2024-01-02"):
+            fetch_converter_bulk(["2024-01-01", "2024-01-02"])
@@ -0,0 +1,25 @@
+import pytest
+
+from hebcal_api import HebcalError, HebcalNetworkError, HebcalParseError, HebcalValidationError
+
+EXCEPTIONS = [HebcalNetworkError, HebcalParseError, HebcalValidationError]
+
+
+class TestExceptions:
+    """Test suite for the exception hierarchy."""
+
+    @pytest.mark.parametrize("cls", EXCEPTIONS)
+    def test_subclasses_hebcal_error(self, cls):
+        """Test that every library error can be caught as HebcalError."""
+        assert issubclass(cls, HebcalError)
+
+    @pytest.mark.parametrize("cls", EXCEPTIONS)
+    def test_raises_with_message(self, cls):
+        """Test that each error carries its message."""
+        with pytest.raises(HebcalError, match=f"{cls.__name__} msg"):
+            raise cls(f"{cls.__name__} msg")
+
+    def test_network_error_status_code(self):
+        """Test that HebcalNetworkError keeps the HTTP status code."""
+        assert HebcalNetworkError("failed", status_code=503).status_code == 503
+        assert HebcalNetworkError("failed").status_code is None
@@ -1,44 +1,145 @@
-from unittest.mock import patch
+from datetime import date, datetime
 
+import httpx
 import pytest
 
-from hebcal_api import LeyningRequest, LeyningResponse, fetch_leyning, fetch_leyning_async
+from hebcal_api import (
+    HebcalValidationError,
+    LeyningRequest,
+    LeyningResponse,
+    fetch_leyning,
+    fetch_leyning_async,
+    fetch_leyning_range,
+    fetch_leyning_range_async,
+)
+
+LEYNING_PAYLOAD = {
+    "date": "2024-01-15",
+    "items": [],
+    "location": "Test",
+    "range": {"start": "2024-01-15", "end": "2024-01-15"},
+}
 
 
 class TestLeyning:
     """Test suite for the Leyning functional API."""
 
-    @patch("hebcal_api.client.fetch_sync")
-    def test_fetch_leyning_basic(self, mock_fetch):
+    def test_fetch_leyning_basic(self, hebcal_routes):
         """Test fetch_leyning with basic parameters."""
-        mock_data = {
-            "date": "2024-01-15",
-            "items": [],
-            "location": "Test",
-            "range": {"start": "2024-01-15", "end": "2024-01-15"},
-        }
-        mock_fetch.return_value = mock_data
+        hebcal_routes["leyning"] = LEYNING_PAYLOAD
 
         req = LeyningRequest(date="2024-01-15")
         result = fetch_leyning(req)
 
         assert isinstance(result, LeyningResponse)
-        mock_fetch.assert_called_once()
+        assert result.range_start == "2024-01-15"
 
-    @patch("hebcal_api.client.fetch_async")
     @pytest.mark.asyncio
-    async def test_fetch_leyning_async_basic(self, mock_fetch_async):
+    async def test_fetch_leyning_async_basic(self, hebcal_routes):
         """Test fetch_leyning_async with basic parameters."""
-        mock_data = {
-            "date": "2024-01-15",
-            "items": [],
-            "location": "Test",
-            "range": {"start": "2024-01-15", "end": "2024-01-15"},
-        }
-        mock_fetch_async.return_value = mock_data
+        hebcal_routes["leyning"] = LEYNING_PAYLOAD
 
         req = LeyningRequest(date="2024-01-15")
         result = await fetch_leyning_async(req)
 
         assert isinstance(result, LeyningResponse)
-        mock_fetch_async.assert_called_once()
+        assert result.range_start == "2024-01-15"
+
+    def test_to_api_params_formats_dates(self):
+        """Test that date, datetime and ISO string inputs all render as YYYY-MM-DD."""
+        assert LeyningRequest(date=date(2024, 1, 15)).to_api_params()["date"] == "2024-01-15"
+        params = LeyningRequest(
+            start=datetime(2024, 1, 15, 18, 30), end="2024-02-01"
+        ).to_api_params()
+        assert params["start"] == "2024-01-15"
+        assert params["end"] == "2024-02-01"
+
+    @pytest.mark.parametrize("value", ["2024-01-15", "1899-12-30", "2000-02-29"])
+    def test_to_api_params_accepts_valid_dates(self, value):
+        """Test that canonical YYYY-MM-DD strings, leap days included, pass through as-is."""
+        assert LeyningRequest(date=value).to_api_params()["date"] == value
+
+    @pytest.mark.parametrize("value", ["2024-1-15", "15-01-2024", "2024-02-30", "2024-0a-15"])
+    def test_to_api_params_rejects_malformed_dates(self, value):
+        """Test that malformed or impossible date strings are rejected."""
+        with pytest.raises(HebcalValidationError):
+            LeyningRequest(date=value).to_api_params()
+
+    def test_fetch_leyning_range_splits_long_ranges(self, hebcal_routes):
+        """Test that a year-long range is fetched in 180-day windows and merged."""
+        windows = []
+
+        def leyning(params):
+            windows.append(params)
+            return {
+                "date": "2024-01-01T00:00:00Z",
+                "location": "Diaspora",
+                "range": {"start": params["start"], "end": params["end"]},
+                "items": [{"date": params["start"], "name": {"en": params["start"]}}],
+            }
+
+        hebcal_routes["leyning"] = leyning
+
+        result = fetch_leyning_range("2024-01-01", "2024-12-31")
+
+        assert [(p["start"], p["end"]) for p in windows] == [
+            ("2024-01-01", "2024-06-28"),
+            ("2024-06-29", "2024-12-25"),
+            ("2024-12-26", "2024-12-31"),
+        ]
+        assert result.range_start == "2024-01-01"
+        assert result.range_end == "2024-12-31"
+        assert len(result.items) == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_leyning_range_async_single_window(self, hebcal_routes):
+        """Test that a short range needs only one request."""
+        windows = []
+
+        def leyning(params):
+            windows.append(params)
+            return {
+                "date": "2024-01-01T00:00:00Z",
+                "location": "Diaspora",
+                "range": {"start": "2024-01-01", "end": "2024-01-31"},
+                "items": [],
+            }
+
+        hebcal_routes["leyning"] = leyning
+
+        result = await fetch_leyning_range_async(date(2024, 1, 1), date(2024, 1, 31))
+
+        assert isinstance(result, LeyningResponse)
+        assert len(windows) == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_leyning_range_rejects_reversed_range(self):
+        """Test that a start after the end is rejected before any request is made."""
+        with pytest.raises(HebcalValidationError, match="must not be after end"):
+            fetch_leyning_range(date(2024, 2, 1), date(2024, 1, 1))
+        with pytest.raises(HebcalValidationError, match="must not be after end"):
+            await fetch_leyning_range_async(date(2024, 2, 1), date(2024, 1, 1))
+
+    @pytest.mark.asyncio
+    async def test_fetch_leyning_range_async_with_client(self, mock_async_client):
+        """Test that a caller-supplied AsyncClient is used for every window."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            return httpx.Response(200, json=LEYNING_PAYLOAD)
+
+        await fetch_leyning_range_async(
+            date(2024, 1, 1), date(2024, 12, 31), client=mock_async_client(handler)
+        )
+
+        assert seen == ["/leyning"] * 3
+
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    @pytest.mark.asyncio
+    async def test_fetch_leyning_range_async_rejects_invalid_concurrency(self, concurrency):
+        """Test that a concurrency below 1 is rejected instead of hanging."""
+        with pytest.raises(HebcalValidationError, match="concurrency must be at least 1"):
+            await fetch_leyning_range_async(
+                date(2024, 1, 1), date(2024, 1, 31), concurrency=concurrency
+            )
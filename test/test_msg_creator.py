@@ -2,13 +2,11 @@
 Test script for the Hebrew Calendar Formatter
 """
 
-import os
-import sys
 from datetime import datetime, timedelta
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+import pytest
 
+from hebcal_api.utils import calendar_formatter
 from hebcal_api.utils.calendar_formatter import (
     format_calendar_events,
     format_hebrew_calendar,
@@ -20,10 +18,25 @@ from hebcal_api.utils.types import (
     CalendarResponse,
 )
 
+# Fixed "now" for the formatter, so date windows are exact and clock-independent.
+NOW = datetime(2024, 1, 15, 12, 0)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Pin the clock the formatter reads to NOW."""
+    monkeypatch.setattr(calendar_formatter, "datetime", _FrozenDatetime)
+
 
 def create_test_events():
     """Create a set of test events for the calendar"""
-    base_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    base_date = NOW.replace(hour=0, minute=0)
 
     # Create events for different days
     return [
@@ -92,56 +105,46 @@ def create_test_events():
     ]
 
 
-def test_calendar_formatter():
-    """Test the calendar formatter with various events"""
-    # Create test events
-    mock_items = create_test_events()
-
-    # Create a mock response
-    mock_data = {
-        "items": mock_items,
-        "title": "לוח שנה עברי",
-        "date": datetime.now().isoformat(),
-        "location": {"title": "ישראל", "tzid": "Asia/Jerusalem"},
-    }
+@pytest.fixture(scope="module")
+def calendar_response():
+    """A calendar response built once from the test events."""
+    return CalendarResponse(
+        {
+            "items": create_test_events(),
+            "title": "לוח שנה עברי",
+            "date": NOW.isoformat(),
+            "location": {"title": "ישראל", "tzid": "Asia/Jerusalem"},
+        }
+    )
 
-    mock_response = CalendarResponse(mock_data)
 
-    # Test full calendar formatting
-    result = format_hebrew_calendar(mock_response)
+def test_format_hebrew_calendar(calendar_response):
+    """Test full calendar formatting."""
+    result = format_hebrew_calendar(calendar_response)
     assert "הדלקת נרות" in result
     assert "פרשת נח" in result
 
-    # Test getting holidays
-    holidays = get_holidays(mock_response)
-    assert len(holidays) >= 1
-    assert any("חנוכה" in h.title for h in holidays)
 
-    # Test getting Shabbat events
-    shabbat_events = get_shabbat_events(mock_response)
-    assert len(shabbat_events) >= 1
+def test_get_holidays_returns_holiday(calendar_response):
+    """Test that only the Hanukkah event is reported as a holiday."""
+    holidays = get_holidays(calendar_response)
+    assert len(holidays) == 1
+    assert "חנוכה" in holidays[0].title
 
-    # Test getting upcoming events
-    upcoming = get_upcoming_events(mock_response, days=14)
-    assert len(upcoming) >= 1
 
-    # Test with empty response
-    empty_response = CalendarResponse({"items": []})
-    empty_result = format_calendar_events(empty_response)
-    assert "אין אירועים" in empty_result
+def test_get_shabbat_events(calendar_response):
+    """Test that candle lighting and havdalah are picked up as Shabbat events."""
+    shabbat_events = get_shabbat_events(calendar_response)
+    assert [e.title for e in shabbat_events] == ["הדלקת נרות", "הבדלה"]
+
 
+def test_get_upcoming_events_within_window(calendar_response):
+    """Test that events in the next two weeks are returned."""
+    upcoming = get_upcoming_events(calendar_response, days=14)
+    assert len(upcoming) == 4
 
-if __name__ == "__main__":
-    mock_items = create_test_events()
-    mock_data = {
-        "items": mock_items,
-        "title": "לוח שנה עברי",
-        "date": datetime.now().isoformat(),
-        "location": {"title": "ישראל", "tzid": "Asia/Jerusalem"},
-    }
-    mock_response = CalendarResponse(mock_data)
-    formatted_text = format_hebrew_calendar(mock_response)
-
-    print("\n--- Formatted Hebrew Calendar ---\n")
-    print(formatted_text)
-    print("\n--- End of Output ---\n")
+
+def test_empty_response_returns_empty():
+    """Test that a response without events renders the empty-calendar message."""
+    empty_result = format_calendar_events(CalendarResponse({"items": []}))
+    assert "אין אירועים" in empty_result
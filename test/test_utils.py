@@ -1,54 +1,237 @@
-from unittest.mock import MagicMock, patch
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
 
+import httpx
 import pytest
 
-from hebcal_api.exceptions import HebcalValidationError
-from hebcal_api.utils.utils import fetch_async, fetch_sync, remove_hebrew_nikud
+from hebcal_api.exceptions import HebcalNetworkError, HebcalParseError, HebcalValidationError
+from hebcal_api.utils import utils
+from hebcal_api.utils.utils import (
+    aclose_async_client,
+    close_sync_client,
+    fetch_async,
+    fetch_content_sync,
+    fetch_many_async,
+    fetch_sync,
+    get_async_client,
+    get_sync_client,
+    remove_hebrew_nikud,
+)
+
+URL = "http://example.com"
+
+
+def _response(content: bytes = b"{}", status_code: int = 200, headers=None) -> httpx.Response:
+    """Build a real httpx response for mocked clients to return."""
+    return httpx.Response(
+        status_code, content=content, headers=headers, request=httpx.Request("GET", URL)
+    )
 
 
 class TestUtils:
     """Test suite for utility functions."""
 
-    @patch("httpx.Client")
-    def test_fetch_sync_success(self, mock_client_class):
+    @patch("hebcal_api.utils.utils.get_sync_client")
+    def test_fetch_sync_success(self, mock_get_client):
         """Test fetch_sync with a successful response."""
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"status": "success"}
-        mock_response.url = "http://example.com"
-        mock_client.get.return_value = mock_response
+        mock_client = mock_get_client.return_value
+        mock_client.get.return_value = _response(b'{"status": "success"}')
 
-        mock_client_class.return_value.__enter__.return_value = mock_client
-
-        result = fetch_sync("http://example.com", params={"key": "value"})
+        result = fetch_sync(URL, params={"key": "value"})
 
         assert result == {"status": "success"}
-        mock_client.get.assert_called_once_with("http://example.com", params={"key": "value"})
+        mock_client.get.assert_called_once_with(
+            URL, params={"key": "value"}, headers=None, timeout=10
+        )
 
-    @patch("httpx.AsyncClient")
     @pytest.mark.asyncio
-    async def test_fetch_async_success(self, mock_client_class):
+    async def test_fetch_async_success(self, mock_async_client):
         """Test fetch_async with a successful response."""
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"status": "success"}
-        mock_response.url = "http://example.com"
-
-        # Async mock setup
-        async def mock_get(*args, **kwargs):
-            return mock_response
+        seen = []
 
-        mock_client.get = mock_get
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"status": "success"})
 
-        result = await fetch_async("http://example.com", params={"key": "value"})
+        client = mock_async_client(handler)
+        result = await fetch_async(URL, params={"key": "value"}, client=client)
 
         assert result == {"status": "success"}
+        assert [dict(request.url.params) for request in seen] == [{"key": "value"}]
+
+    @pytest.mark.parametrize(
+        ("status_code", "body", "error"),
+        [
+            (404, "can't find geonameid 123", HebcalValidationError),
+            (500, "server error", HebcalNetworkError),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_fetch_async_http_errors(self, mock_async_client, status_code, body, error):
+        """Test that HTTP errors surface as the matching library exception."""
+        client = mock_async_client(lambda request: httpx.Response(status_code, text=body))
+
+        with pytest.raises(error, match=body):
+            await fetch_async(URL, client=client)
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_async_bounds_concurrency(self):
+        """Test that batched fetches overlap up to the limit and keep input order."""
+        in_flight = peak = 0
+
+        async def get(url, params=None, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _response(f'{{"n": {params["n"]}}}'.encode())
+
+        client = SimpleNamespace(get=get)
+        results = await fetch_many_async(
+            [(URL, {"n": n}) for n in range(10)], client=client, concurrency=4
+        )
+
+        assert results == [{"n": n} for n in range(10)]
+        assert peak == 4
+
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    @pytest.mark.asyncio
+    async def test_fetch_many_async_rejects_invalid_concurrency(self, concurrency):
+        """Test that a concurrency below 1 is rejected instead of hanging."""
+        with pytest.raises(HebcalValidationError, match="concurrency must be at least 1"):
+            await fetch_many_async([(URL, None)], concurrency=concurrency)
+
+    @patch("hebcal_api.utils.utils.get_sync_client")
+    def test_fetch_content_sync_revalidates_with_etag(self, mock_get_client):
+        """Test that a stored ETag is sent back and a 304 reuses the earlier body."""
+        mock_client = mock_get_client.return_value
+        mock_client.get.side_effect = [
+            _response(b'{"title": "v1"}', headers={"ETag": '"abc"'}),
+            _response(b"", status_code=304),
+        ]
+
+        assert fetch_content_sync(URL, params={"year": 2024}, revalidate=True) == (
+            b'{"title": "v1"}'
+        )
+        assert fetch_content_sync(URL, params={"year": 2024}, revalidate=True) == (
+            b'{"title": "v1"}'
+        )
+
+        second_call = mock_client.get.call_args_list[1]
+        assert second_call.kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+    @patch("hebcal_api.utils.utils.get_sync_client")
+    def test_fetch_sync_keeps_no_validators_by_default(self, mock_get_client):
+        """Test that plain fetches neither store bodies nor send If-None-Match."""
+        mock_client = mock_get_client.return_value
+        mock_client.get.return_value = _response(b"{}", headers={"ETag": '"abc"'})
+
+        fetch_sync(URL)
+        fetch_sync(URL)
+
+        assert mock_client.get.call_args_list[1].kwargs["headers"] is None
+        assert not utils._validators
+
+    @patch("hebcal_api.utils.utils.get_sync_client")
+    def test_fetch_sync_invalid_json(self, mock_get_client):
+        """Test that a malformed body raises HebcalParseError."""
+        mock_get_client.return_value.get.return_value = _response(b"<html>")
+
+        with pytest.raises(HebcalParseError, match="Invalid JSON response"):
+            fetch_sync(URL)
+
+    @patch("hebcal_api.utils.utils.get_sync_client")
+    def test_fetch_sync_uses_given_client(self, mock_get_client):
+        """Test that an explicit client is used instead of the shared one."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={})
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            assert fetch_sync(URL, client=client) == {}
+
+        assert len(seen) == 1
+        mock_get_client.assert_not_called()
+
+    def test_sync_client_is_shared(self):
+        """Test that repeated calls reuse one pooled client until it is closed."""
+        client = get_sync_client()
+        assert get_sync_client() is client
+
+        close_sync_client()
+        assert client.is_closed
+        assert get_sync_client() is not client
+        close_sync_client()
+
+    @pytest.mark.asyncio
+    async def test_async_client_is_shared_per_loop(self):
+        """Test that the async client is reused within the running event loop."""
+        client = get_async_client()
+        assert get_async_client() is client
+        await client.aclose()
+        assert get_async_client() is not client
+        await aclose_async_client()
+
+    def test_leftover_async_clients_closed_at_exit(self):
+        """Test that the exit hook closes async clients whose loop is still open."""
+
+        async def borrow() -> httpx.AsyncClient:
+            return get_async_client()
+
+        loop = asyncio.new_event_loop()
+        try:
+            client = loop.run_until_complete(borrow())
+            assert not client.is_closed
+            utils._close_async_clients()
+            assert client.is_closed
+        finally:
+            loop.close()
+
+    def test_fetch_sync_decodes_with_json_loads(self, monkeypatch):
+        """Test that bodies are decoded by the shared json_loads backend."""
+        calls = []
+        loads = utils.json_loads
+
+        def counting_loads(content):
+            calls.append(content)
+            return loads(content)
+
+        monkeypatch.setattr(utils, "json_loads", counting_loads)
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"a": 1}))
+        with httpx.Client(transport=transport) as client:
+            assert fetch_sync(URL, client=client) == {"a": 1}
+
+        assert calls == [b'{"a":1}']
+
+    @pytest.mark.asyncio
+    async def test_async_client_reused_across_calls(self, monkeypatch):
+        """Test that concurrent fetches on one loop share a single pooled client."""
+        created = []
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+
+        class RecordingClient(httpx.AsyncClient):
+            def __init__(self, **kwargs):
+                super().__init__(transport=transport, **kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(httpx, "AsyncClient", RecordingClient)
+
+        results = await asyncio.gather(*(fetch_async(URL, params={"n": n}) for n in range(10)))
+
+        assert results == [{}] * 10
+        assert len(created) == 1
+        await aclose_async_client()
 
-    def test_remove_hebrew_nikud(self):
+    @pytest.mark.parametrize(
+        ("text", "expected"), [("שָׁלוֹם", "שלום"), ("יִשְׂרָאֵל", "ישראל"), ("שלום", "שלום")]
+    )
+    def test_remove_hebrew_nikud(self, text, expected):
         """Test removing Hebrew nikud."""
-        assert remove_hebrew_nikud("שָׁלוֹם") == "שלום"
-        assert remove_hebrew_nikud("יִשְׂרָאֵל") == "ישראל"
+        assert remove_hebrew_nikud(text) == expected
 
     def test_remove_hebrew_nikud_empty(self):
         with pytest.raises(HebcalValidationError):
@@ -1,35 +1,169 @@
+import asyncio
+import json
 from unittest.mock import patch
 
+import httpx
 import pytest
 
-from hebcal_api import ZmanimRequest, fetch_zmanim, fetch_zmanim_async
+from hebcal_api import (
+    HebcalValidationError,
+    ZmanimRequest,
+    configure_cache,
+    fetch_zmanim,
+    fetch_zmanim_async,
+    fetch_zmanim_many_async,
+    iter_zmanim_async,
+)
 from hebcal_api.utils.types import ZmanimResponse
 
+ZMANIM_PAYLOAD = {"date": "2024-01-15", "version": "1.0", "location": {}, "times": {}}
+
 
 class TestZmanim:
     """Test suite for the Zmanim functional API."""
 
-    @patch("hebcal_api.client.fetch_sync")
-    def test_fetch_zmanim_basic(self, mock_fetch):
+    def test_fetch_zmanim_basic(self, hebcal_routes):
         """Test fetch_zmanim with basic parameters."""
-        mock_data = {"date": "2024-01-15", "version": "1.0", "location": {}, "times": {}}
-        mock_fetch.return_value = mock_data
+        hebcal_routes["zmanim"] = ZMANIM_PAYLOAD
 
         req = ZmanimRequest(date="2024-01-15", geonameid=12345)
         result = fetch_zmanim(req)
 
         assert isinstance(result, ZmanimResponse)
-        mock_fetch.assert_called_once()
+        assert result.date == "2024-01-15"
 
-    @patch("hebcal_api.client.fetch_async")
     @pytest.mark.asyncio
-    async def test_fetch_zmanim_async_basic(self, mock_fetch_async):
+    async def test_fetch_zmanim_async_basic(self, hebcal_routes):
         """Test fetch_zmanim_async with basic parameters."""
-        mock_data = {"date": "2024-01-15", "version": "1.0", "location": {}, "times": {}}
-        mock_fetch_async.return_value = mock_data
+        hebcal_routes["zmanim"] = ZMANIM_PAYLOAD
 
         req = ZmanimRequest(date="2024-01-15", geonameid=12345)
         result = await fetch_zmanim_async(req)
 
         assert isinstance(result, ZmanimResponse)
-        mock_fetch_async.assert_called_once()
+        assert result.date == "2024-01-15"
+
+    def test_fetch_zmanim_date_range_single_request(self, hebcal_routes):
+        """Test that a start/end range is fetched in one request, not one per day."""
+        seen = []
+
+        def zmanim(params):
+            seen.append(params)
+            return ZMANIM_PAYLOAD
+
+        hebcal_routes["zmanim"] = zmanim
+
+        fetch_zmanim(ZmanimRequest(start="2024-01-01", end="2024-01-31", geonameid=12345))
+
+        assert len(seen) == 1
+        assert (seen[0]["start"], seen[0]["end"]) == ("2024-01-01", "2024-01-31")
+
+    @pytest.mark.asyncio
+    async def test_fetch_zmanim_async_with_client(self, mock_async_client):
+        """Test that a caller-supplied AsyncClient is used for the request."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            return httpx.Response(200, json=ZMANIM_PAYLOAD)
+
+        req = ZmanimRequest(date="2024-01-15", geonameid=12345)
+        result = await fetch_zmanim_async(req, client=mock_async_client(handler))
+
+        assert isinstance(result, ZmanimResponse)
+        assert seen == ["/zmanim"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_zmanim_many_async_preserves_order(self, hebcal_routes):
+        """Test that batched Zmanim lookups keep input order."""
+        seen = []
+
+        def zmanim(params):
+            seen.append(params)
+            return {**ZMANIM_PAYLOAD, "date": params["date"]}
+
+        hebcal_routes["zmanim"] = zmanim
+
+        dates = ["2024-01-15", "2024-01-03", "2024-01-27"]
+        results = await fetch_zmanim_many_async(
+            [ZmanimRequest(date=d, geonameid=12345) for d in dates], concurrency=2
+        )
+
+        assert [r.date for r in results] == dates
+        assert len(seen) == 3
+
+    @patch("hebcal_api.client.fetch_content_async")
+    @pytest.mark.asyncio
+    async def test_iter_zmanim_async_yields_in_completion_order(self, mock_fetch_async):
+        """Test that streamed lookups arrive as they complete, not in input order."""
+
+        async def fake_fetch(url, params=None, **kwargs):
+            await asyncio.sleep(0.01 if params["date"] == "2024-01-01" else 0)
+            return json.dumps({**ZMANIM_PAYLOAD, "date": params["date"]}).encode()
+
+        mock_fetch_async.side_effect = fake_fetch
+
+        requests = [ZmanimRequest(date=d, geonameid=12345) for d in ["2024-01-01", "2024-01-02"]]
+        results = [(req.date, res.date) async for req, res in iter_zmanim_async(requests)]
+
+        assert results == [("2024-01-02", "2024-01-02"), ("2024-01-01", "2024-01-01")]
+
+    @patch("hebcal_api.client.fetch_content_async")
+    @pytest.mark.asyncio
+    async def test_iter_zmanim_async_early_exit_reaps_tasks(self, mock_fetch_async):
+        """Test that breaking out of the stream leaves no sibling task pending."""
+
+        async def fake_fetch(url, params=None, **kwargs):
+            await asyncio.sleep(0 if params["date"] == "2024-01-01" else 10)
+            return json.dumps({**ZMANIM_PAYLOAD, "date": params["date"]}).encode()
+
+        mock_fetch_async.side_effect = fake_fetch
+        configure_cache(ttl=0)  # no shielded cache fills outliving the stream
+
+        requests = [ZmanimRequest(date=d, geonameid=12345) for d in ["2024-01-01", "2024-01-02"]]
+        stream = iter_zmanim_async(requests)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        current = asyncio.current_task()
+        assert all(task.done() for task in asyncio.all_tasks() if task is not current)
+
+    @pytest.mark.asyncio
+    async def test_batch_zmanim_with_client(self, mock_async_client):
+        """Test that batched and streamed lookups forward a caller-supplied AsyncClient."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.params["date"])
+            return httpx.Response(200, json={**ZMANIM_PAYLOAD, "date": seen[-1]})
+
+        client = mock_async_client(handler)
+        await fetch_zmanim_many_async(
+            [ZmanimRequest(date="2024-01-01", geonameid=12345)], client=client
+        )
+        requests = [ZmanimRequest(date="2024-01-02", geonameid=12345)]
+        assert [res.date async for _, res in iter_zmanim_async(requests, client=client)] == [
+            "2024-01-02"
+        ]
+        assert seen == ["2024-01-01", "2024-01-02"]
+
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    @pytest.mark.asyncio
+    async def test_batch_zmanim_rejects_invalid_concurrency(self, concurrency):
+        """Test that a concurrency below 1 is rejected instead of hanging."""
+        requests = [ZmanimRequest(date="2024-01-15", geonameid=12345)]
+        with pytest.raises(HebcalValidationError, match="concurrency must be at least 1"):
+            await fetch_zmanim_many_async(requests, concurrency=concurrency)
+        with pytest.raises(HebcalValidationError, match="concurrency must be at least 1"):
+            async for _ in iter_zmanim_async(requests, concurrency=concurrency):
+                pass
+
+    def test_geo_resolved_from_location(self):
+        """Test that the geo mode follows the location fields provided."""
+        assert ZmanimRequest(geonameid=281184).geo == "geoname"
+        assert ZmanimRequest(city="Jerusalem").geo == "city"
+        assert ZmanimRequest(latitude=0.0, longitude=0.0).geo == "pos"
+
+        with pytest.raises(ValueError, match="Must provide geonameid"):
+            ZmanimRequest(date="2024-01-15")